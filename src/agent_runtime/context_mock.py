@@ -4,7 +4,7 @@ Mock context classes for testing.
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentState:
     tenant_id: str
     workflow_id: Optional[str] = None
@@ -17,7 +17,7 @@ class AgentState:
             "step_id": self.step_id
         }
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     state: AgentState
     model_config: Dict[str, Any]
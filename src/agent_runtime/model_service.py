@@ -68,7 +68,7 @@ class MockModelService(ModelService):
         
     async def invoke(self, prompt: str, parameters: Optional[Dict[str, Any]] = None) -> str:
         """Mock model invocation."""
-        start_time = time.time()
+        start_time = time.monotonic_ns()
         try:
             if not prompt:
                 raise ValueError("Empty prompt")
@@ -77,29 +77,37 @@ class MockModelService(ModelService):
             await asyncio.sleep(0.1)
             
             response = f"Mock response for: {prompt[:50]}"
-            self.metrics.record_request(True, (time.time() - start_time) * 1000)
+            self.metrics.record_request(True, (time.monotonic_ns() - start_time) / 1_000_000)
             return response
             
         except Exception as e:
-            self.metrics.record_request(False, (time.time() - start_time) * 1000)
+            self.metrics.record_request(False, (time.monotonic_ns() - start_time) / 1_000_000)
             raise
         
+    async def _generate(self, index: int, prompt: str) -> str:
+        """Simulate one prompt of a batch."""
+        await asyncio.sleep(0.1)
+        return f"Mock response {index}: {prompt[:50]}"
+        
     async def batch_invoke(self, prompts: List[str], parameters: Optional[Dict[str, Any]] = None) -> List[str]:
-        """Mock batch inference."""
-        start_time = time.time()
-        try:
-            if not prompts:
-                raise ValueError("Empty prompts list")
-                
-            # Simulate processing time
-            await asyncio.sleep(0.1)
+        """Mock batch inference.
+        
+        Prompts are generated concurrently, so a batch takes roughly as long
+        as a single call and is recorded as one request.
+        """
+        if not prompts:
+            return []
             
-            responses = [f"Mock response {i}: {p[:50]}" for i, p in enumerate(prompts)]
-            self.metrics.record_request(True, (time.time() - start_time) * 1000)
+        start_time = time.monotonic_ns()
+        try:
+            responses = list(await asyncio.gather(
+                *(self._generate(i, p) for i, p in enumerate(prompts))
+            ))
+            self.metrics.record_request(True, (time.monotonic_ns() - start_time) / 1_000_000)
             return responses
             
         except Exception as e:
-            self.metrics.record_request(False, (time.time() - start_time) * 1000)
+            self.metrics.record_request(False, (time.monotonic_ns() - start_time) / 1_000_000)
             raise
 
 class ModelServiceFactory:
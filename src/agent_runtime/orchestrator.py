@@ -2,8 +2,10 @@
 Orchestration Layer implementation for Agent360.
 Handles ReAct framework, chain-of-thought processing, and state management.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Deque
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 import logging
 from enum import Enum
 
@@ -26,18 +28,19 @@ class Memory:
     """Handles memory management for the agent."""
     
     def __init__(self, max_short_term_items: int = 100):
-        self.short_term = []
+        # Bounded deque drops the oldest thought in O(1) when full
+        self.short_term: Deque[Thought] = deque(maxlen=max_short_term_items)
         self.max_short_term_items = max_short_term_items
         
     def add_thought(self, thought: Thought) -> None:
         """Add a thought to short-term memory."""
         self.short_term.append(thought)
-        if len(self.short_term) > self.max_short_term_items:
-            self.short_term.pop(0)
             
     def get_recent_thoughts(self, limit: int = 10) -> List[Thought]:
         """Get recent thoughts from memory."""
-        return self.short_term[-limit:]
+        recent = list(islice(reversed(self.short_term), limit))
+        recent.reverse()
+        return recent
 
 class Orchestrator:
     """Main orchestration class implementing ReAct framework."""
@@ -94,6 +94,12 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
+    # Write out queued workflow events before the database goes away
+    if getattr(app.state, "workflow_service", None):
+        try:
+            await app.state.workflow_service.close()
+        except Exception as e:
+            logger.error(f"Failed to stop workflow service: {str(e)}")
     if app.state.db:
         await app.state.db.disconnect()
 
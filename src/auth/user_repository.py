@@ -2,8 +2,11 @@
 User repository for Agent360.
 """
 import logging
+import time
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Union
 from uuid import UUID, uuid4
 
 from src.database.schema import User
@@ -11,16 +14,44 @@ from src.database.connection import get_connection, DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
+def _copy_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a user row, including nested values such as the roles list."""
+    return deepcopy(dict(user))
+
+def _as_uuid(value: Union[UUID, str]) -> UUID:
+    """Normalise a user ID so str and UUID forms share one cache key.
+    
+    Raises:
+        ValueError: If ``value`` is not a valid UUID
+    """
+    return value if isinstance(value, UUID) else UUID(str(value))
+
 class UserRepository:
     """Repository for user management."""
     
-    def __init__(self, db: Optional[DatabaseConnection] = None):
+    def __init__(self, db: Optional[DatabaseConnection] = None,
+                 cache_ttl: float = 2.0, cache_size: int = 1024):
         """Initialize repository.
         
         Args:
             db: Optional database connection
+            cache_ttl: Seconds a user looked up by ID stays cached. Writes
+                only evict this instance's cache, so this bounds how long
+                other instances may still see a locked or deleted user
+            cache_size: Maximum number of cached users
         """
         self.db = db or get_connection()
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._user_cache: OrderedDict[UUID, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        
+    def _invalidate(self, user_id: Union[UUID, str]) -> None:
+        """Drop a user from the ID lookup cache.
+        
+        Args:
+            user_id: User ID to evict
+        """
+        self._user_cache.pop(_as_uuid(user_id), None)
         
     async def get_user_by_username(self, username: str, tenant_id: str) -> Optional[Dict[str, Any]]:
         """Get user by username.
@@ -36,18 +67,73 @@ class UserRepository:
         result = self.db.execute(query, {'username': username, 'tenant_id': tenant_id})
         return result[0] if result else None
     
-    async def get_user_by_id(self, user_id: UUID) -> Optional[Dict[str, Any]]:
+    async def get_user_by_id(self, user_id: Union[UUID, str]) -> Optional[Dict[str, Any]]:
         """Get user by ID.
         
         Args:
-            user_id: User ID to look up
+            user_id: User ID to look up, as a UUID or its string form
             
         Returns:
             User data if found, None otherwise
+            
+        Raises:
+            ValueError: If ``user_id`` is not a valid UUID
         """
+        user_id = _as_uuid(user_id)
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            expires_at, user = cached
+            if time.monotonic() < expires_at:
+                self._user_cache.move_to_end(user_id)
+                return _copy_user(user)
+            del self._user_cache[user_id]
+            
         query = "SELECT * FROM users WHERE id = %s"
         result = self.db.execute(query, {'id': user_id})
-        return result[0] if result else None
+        if not result:
+            return None
+            
+        # Callers get their own copy, so mutating it cannot touch the cache
+        user = result[0]
+        self._user_cache[user_id] = (time.monotonic() + self.cache_ttl, _copy_user(user))
+        if len(self._user_cache) > self.cache_size:
+            self._user_cache.popitem(last=False)
+        return user
+    
+    async def get_users_by_ids(self, user_ids: List[Union[UUID, str]]) -> List[Dict[str, Any]]:
+        """Get several users by ID with a single query.
+        
+        Args:
+            user_ids: User IDs to look up, as UUIDs or their string form
+            
+        Returns:
+            Users found, in the order of ``user_ids``
+            
+        Raises:
+            ValueError: If any ID is not a valid UUID
+        """
+        user_ids = [_as_uuid(user_id) for user_id in user_ids]
+        now = time.monotonic()
+        users: Dict[UUID, Dict[str, Any]] = {}
+        missing = []
+        for user_id in user_ids:
+            cached = self._user_cache.get(user_id)
+            if cached is not None and now < cached[0]:
+                users[user_id] = _copy_user(cached[1])
+            elif user_id not in missing:
+                missing.append(user_id)
+                
+        if missing:
+            query = "SELECT * FROM users WHERE id IN %s"
+            expires_at = now + self.cache_ttl
+            for user in self.db.execute(query, {'ids': tuple(missing)}):
+                user_id = _as_uuid(user['id'])
+                users[user_id] = user
+                self._user_cache[user_id] = (expires_at, _copy_user(user))
+            while len(self._user_cache) > self.cache_size:
+                self._user_cache.popitem(last=False)
+                
+        return [users[user_id] for user_id in user_ids if user_id in users]
     
     async def create_user(self, username: str, hashed_password: str, email: str,
                          tenant_id: str, roles: List[str]) -> Dict[str, Any]:
@@ -88,16 +174,33 @@ class UserRepository:
         
         return user
     
-    async def update_user(self, user_id: UUID, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def update_user(self, user_id: UUID, updates: Dict[str, Any],
+                          current: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Update user data.
         
         Args:
             user_id: User ID to update
             updates: Fields to update
+            current: Optional user data already held by the caller; when
+                given, only the row's existence is checked instead of
+                re-reading the whole row
             
         Returns:
             Updated user data if successful, None if user not found
         """
+        # Cassandra's UPDATE is an upsert, so check the row exists rather
+        # than recreate a missing user as a partial row. A plain read is
+        # much cheaper than a conditional (Paxos) update.
+        if current is None:
+            query = "SELECT * FROM users WHERE id = %s"
+        else:
+            query = "SELECT id FROM users WHERE id = %s"
+        result = self.db.execute(query, {'id': user_id})
+        if not result:
+            return None
+        if current is None:
+            current = result[0]
+            
         updates['updated_at'] = datetime.utcnow()
         
         set_clause = ', '.join(f"{k} = %s" for k in updates.keys())
@@ -105,8 +208,9 @@ class UserRepository:
         
         params = list(updates.values()) + [user_id]
         self.db.execute(query, params)
+        self._invalidate(user_id)
         
-        return await self.get_user_by_id(user_id)
+        return {**current, **updates}
     
     async def delete_user(self, user_id: UUID) -> bool:
         """Delete a user.
@@ -119,6 +223,7 @@ class UserRepository:
         """
         query = "DELETE FROM users WHERE id = %s"
         self.db.execute(query, {'id': user_id})
+        self._invalidate(user_id)
         return True
     
     async def increment_failed_attempts(self, username: str, tenant_id: str) -> Optional[int]:
@@ -153,6 +258,7 @@ class UserRepository:
             'updated_at': datetime.utcnow(),
             'id': user['id']
         })
+        self._invalidate(user['id'])
         
         return new_attempts
     
@@ -179,5 +285,6 @@ class UserRepository:
             'updated_at': datetime.utcnow(),
             'id': user['id']
         })
+        self._invalidate(user['id'])
         
         return True
@@ -1,9 +1,11 @@
 """Database connection management for Agent360."""
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Union
 from cassandra.cluster import Cluster, Session
 from cassandra.auth import PlainTextAuthProvider
 from cassandra.policies import DCAwareRoundRobinPolicy
+from cassandra.query import BatchStatement, BatchType, PreparedStatement
 
 from ..config import get_settings
 
@@ -124,7 +126,10 @@ class DatabaseConnection:
             self._cluster = MockCluster()
             
     def execute(self, query: str, params: Optional[Dict[str, Any]] = None) -> list:
-        """Execute a query.
+        """Execute a query, blocking the caller.
+        
+        Errors are logged and reported as an empty result. Coroutines
+        should use the async methods instead, which raise them.
         
         Args:
             query: Query to execute
@@ -143,6 +148,103 @@ class DatabaseConnection:
             logger.error(f"Query execution failed: {str(e)}")
             return []
             
+    async def execute_in_executor(
+        self,
+        query: Union[str, PreparedStatement],
+        params: Optional[Union[Dict[str, Any], Sequence[Any]]] = None
+    ) -> list:
+        """Execute a query without blocking the event loop.
+        
+        The driver call runs on the default thread pool executor, so
+        concurrent queries overlap instead of serializing on the loop.
+        
+        Args:
+            query: Query text or prepared statement
+            params: Query parameters
+            
+        Returns:
+            Query results, or an empty list in offline mode
+            
+        Raises:
+            Exception: If the driver fails to execute the query
+        """
+        if self.offline_mode:
+            return []
+            
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._execute_rows, query, params)
+            
+    def _execute_rows(
+        self,
+        query: Union[str, PreparedStatement],
+        params: Optional[Union[Dict[str, Any], Sequence[Any]]]
+    ) -> list:
+        """Run a query on the session and materialize its rows.
+        
+        Args:
+            query: Query text or prepared statement
+            params: Query parameters
+            
+        Returns:
+            Query results
+        """
+        return list(self._session.execute(query, params))
+            
+    async def prepare(self, query: str) -> Any:
+        """Prepare a statement so the server parses and plans it only once.
+        
+        Args:
+            query: Query with positional ? markers
+            
+        Returns:
+            Prepared statement, or the query text unchanged in offline mode
+        """
+        if self.offline_mode:
+            return query
+            
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._session.prepare, query)
+            
+    def _execute_batch(
+        self,
+        query: Union[str, PreparedStatement],
+        params_list: List[Sequence[Any]]
+    ) -> None:
+        """Send one prepared statement for many parameter sets as a single batch.
+        
+        Args:
+            query: Query text, prepared here, or an already prepared statement
+            params_list: Parameters for each row
+        """
+        statement = (
+            self._session.prepare(query) if isinstance(query, str) else query
+        )
+        batch = BatchStatement(batch_type=BatchType.UNLOGGED)
+        for params in params_list:
+            batch.add(statement, params)
+        self._session.execute(batch)
+            
+    async def execute_many(
+        self,
+        query: Union[str, PreparedStatement],
+        params_list: List[Sequence[Any]]
+    ) -> None:
+        """Execute a query for many parameter sets in one round trip.
+        
+        Args:
+            query: Query text, or a statement from prepare to skip
+                re-preparing it on every call
+            params_list: Parameters for each row
+            
+        Raises:
+            Exception: If preparing or executing the batch fails
+        """
+        if self.offline_mode or not params_list:
+            return
+            
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._execute_batch, query, params_list)
+            
     def execute_async(self, query: str, params: Optional[Dict[str, Any]] = None):
         """Execute a query asynchronously.
         
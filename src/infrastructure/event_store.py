@@ -2,10 +2,11 @@
 Event store for workflow event sourcing.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from opentelemetry import trace
 from opentelemetry.trace import Span
@@ -27,6 +28,13 @@ EVENT_LATENCY = Histogram(
     ['operation']
 )
 
+# Insert statement for a single workflow event
+INSERT_EVENT_QUERY = """
+    INSERT INTO workflow_events (
+        id, workflow_id, type, data, metadata, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 class EventStore:
     """Store for workflow events."""
     
@@ -39,6 +47,7 @@ class EventStore:
             database_client: Database client for persistence
         """
         self.database = database_client
+        self._insert_statement = None
     
     @classmethod
     async def get_instance(cls) -> 'EventStore':
@@ -76,35 +85,13 @@ class EventStore:
             span.set_attribute("event.type", event_type)
             
             try:
-                # Generate event ID
-                event_id = str(UUID())
-                
-                # Create event record
-                event = {
-                    "id": event_id,
-                    "workflow_id": str(workflow_id),
-                    "type": event_type,
-                    "data": event_data,
-                    "metadata": metadata or {},
-                    "created_at": datetime.utcnow().isoformat(),
-                }
+                event_id, params = self._event_params(
+                    workflow_id, event_type, event_data, metadata
+                )
                 
                 # Store in database
-                query = """
-                    INSERT INTO workflow_events (
-                        id, workflow_id, type, data, metadata, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                """
-                await self.database.execute(
-                    query,
-                    [
-                        event_id,
-                        str(workflow_id),
-                        event_type,
-                        event_data,
-                        metadata,
-                        event["created_at"],
-                    ]
+                await self.database.execute_in_executor(
+                    await self._prepared_insert(), params
                 )
                 
                 EVENT_OPERATIONS.labels(operation="store").inc()
@@ -116,6 +103,96 @@ class EventStore:
                 span.record_exception(e)
                 raise
     
+    async def _prepared_insert(self) -> Any:
+        """Get the prepared insert statement, preparing it on first use.
+        
+        Returns:
+            Prepared statement shared by every event insert
+        """
+        if self._insert_statement is None:
+            self._insert_statement = await self.database.prepare(INSERT_EVENT_QUERY)
+        return self._insert_statement
+    
+    async def store_event_many(
+        self,
+        events: List[Dict[str, Any]]
+    ) -> List[str]:
+        """Store several workflow events, one batch per workflow.
+        
+        Events are grouped by workflow_id, the partition key, so each
+        batch touches a single partition; the batches run concurrently.
+        
+        Args:
+            events: Events as dicts with workflow_id, event_type,
+                event_data and optional metadata keys
+            
+        Returns:
+            Event IDs in input order
+        """
+        if not events:
+            return []
+        
+        with tracer.start_as_current_span("event.store_many") as span:
+            span.set_attribute("event.count", len(events))
+            
+            try:
+                event_ids = []
+                by_workflow: Dict[str, List[list]] = {}
+                for event in events:
+                    event_id, event_params = self._event_params(
+                        event["workflow_id"],
+                        event["event_type"],
+                        event["event_data"],
+                        event.get("metadata")
+                    )
+                    event_ids.append(event_id)
+                    by_workflow.setdefault(event_params[1], []).append(event_params)
+                
+                # A multi-partition batch makes the coordinator fan out to
+                # every partition, so send one single-partition batch each
+                statement = await self._prepared_insert()
+                await asyncio.gather(*(
+                    self.database.execute_many(statement, rows)
+                    for rows in by_workflow.values()
+                ))
+                
+                EVENT_OPERATIONS.labels(operation="store_many").inc()
+                return event_ids
+                
+            except Exception as e:
+                logger.error(f"Failed to store events: {e}")
+                span.set_status(Status(StatusCode.ERROR))
+                span.record_exception(e)
+                raise
+    
+    @staticmethod
+    def _event_params(
+        workflow_id: UUID,
+        event_type: str,
+        event_data: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]]
+    ) -> tuple:
+        """Build the insert parameters for an event.
+        
+        Args:
+            workflow_id: Workflow ID
+            event_type: Type of event
+            event_data: Event data
+            metadata: Optional metadata
+            
+        Returns:
+            Tuple of event ID and insert parameters
+        """
+        event_id = str(uuid4())
+        return event_id, [
+            event_id,
+            str(workflow_id),
+            event_type,
+            event_data,
+            metadata,
+            datetime.utcnow().isoformat(),
+        ]
+    
     async def get_events(
         self,
         workflow_id: UUID,
@@ -163,8 +240,7 @@ class EventStore:
                     ORDER BY created_at ASC
                 """
                 
-                result = await self.database.execute(sql, params)
-                rows = await result.fetchall()
+                rows = await self.database.execute_in_executor(sql, params)
                 
                 # Convert to list of dicts
                 events = []
@@ -187,3 +263,123 @@ class EventStore:
                 span.set_status(Status(StatusCode.ERROR))
                 span.record_exception(e)
                 raise
+
+class EventBuffer:
+    """Bounded queue of event writes stored in batches by a background task.
+    
+    put() hands back a future per event. It resolves to the event ID once
+    the batch holding the event is stored, or raises the error that batch
+    failed with, so each caller learns the outcome of its own events. An
+    event is only guaranteed to be saved once its future has resolved:
+    events still queued or being written when the process dies are lost,
+    and a caller that drops the future gets no confirmation. Once
+    ``max_queued`` events are waiting, put() blocks until the drain task
+    catches up, so a slow database cannot grow the queue without bound.
+    """
+    
+    # Maximum number of events written per batch
+    MAX_BATCH_SIZE = 100
+    # Default number of events that may wait before put() blocks
+    MAX_QUEUED = 1000
+    
+    def __init__(self, event_store: EventStore, max_queued: int = MAX_QUEUED):
+        """Initialize event buffer.
+        
+        Args:
+            event_store: Event store the buffered events are written to
+            max_queued: Number of queued events at which put() blocks
+        """
+        self.event_store = event_store
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queued)
+        self._drain_task: Optional[asyncio.Task] = None
+    
+    async def put(
+        self,
+        workflow_id: UUID,
+        event_type: str,
+        event_data: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> asyncio.Future:
+        """Queue a workflow event for storage, waiting while the queue is full.
+        
+        Args:
+            workflow_id: Workflow ID
+            event_type: Type of event
+            event_data: Event data
+            metadata: Optional metadata
+            
+        Returns:
+            Future resolving to the event ID once it is stored, or raising
+            the error that stopped its batch from being stored
+        """
+        event = {
+            "workflow_id": workflow_id,
+            "event_type": event_type,
+            "event_data": event_data
+        }
+        if metadata is not None:
+            event["metadata"] = metadata
+        
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self._drain())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((event, future))
+        return future
+    
+    async def _drain(self) -> None:
+        """Write queued events in batches until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.MAX_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            try:
+                event_ids = await self.event_store.store_event_many(
+                    [event for event, _ in batch]
+                )
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                logger.error(f"Failed to store {len(batch)} events: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                        # Logged above, so callers that dropped the
+                        # future don't trigger a second warning
+                        future.exception()
+            else:
+                for (_, future), event_id in zip(batch, event_ids):
+                    if not future.done():
+                        future.set_result(event_id)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    async def flush(self) -> None:
+        """Wait until every event queued so far has been written or has failed.
+        
+        Failures are reported through each event's future, not here.
+        """
+        if self._drain_task is not None:
+            await self._queue.join()
+    
+    async def close(self) -> None:
+        """Flush queued events and stop the drain task."""
+        if self._drain_task is None:
+            return
+        try:
+            await self.flush()
+        finally:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+            # Only left over if the flush itself was cancelled
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+                self._queue.task_done()
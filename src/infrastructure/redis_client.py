@@ -2,10 +2,10 @@
 Redis client service for Agent360.
 """
 
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
+import orjson
 from redis import Redis, ConnectionPool
 from prometheus_client import Counter, Histogram
 from opentelemetry import trace
@@ -92,8 +92,8 @@ class RedisClient:
                     if value is not None:
                         CACHE_HITS.labels('get').inc()
                         try:
-                            return json.loads(value)
-                        except json.JSONDecodeError:
+                            return orjson.loads(value)
+                        except orjson.JSONDecodeError:
                             return value
                     
                     CACHE_MISSES.labels('get').inc()
@@ -126,7 +126,10 @@ class RedisClient:
             with OPERATION_LATENCY.labels('set').time():
                 try:
                     if not isinstance(value, (str, bytes)):
-                        value = json.dumps(value)
+                        value = orjson.dumps(
+                            value,
+                            option=orjson.OPT_NON_STR_KEYS
+                        )
                     
                     if ttl is not None:
                         return bool(self.client.setex(key, ttl, value))
@@ -136,7 +139,82 @@ class RedisClient:
                     logger.error(f"Redis SET error: {e}")
                     span.record_exception(e)
                     return False
-    
+
+    async def mget(
+        self,
+        keys: List[str],
+        default: Any = None
+    ) -> List[Any]:
+        """Get multiple values from Redis in a single round trip.
+
+        Args:
+            keys: Keys to get
+            default: Default value for keys that don't exist
+
+        Returns:
+            Values in the same order as keys
+        """
+        with tracer.start_as_current_span('redis.mget') as span:
+            span.set_attribute('redis.key_count', len(keys))
+
+            with OPERATION_LATENCY.labels('mget').time():
+                try:
+                    values = self.client.mget(keys)
+                except Exception as e:
+                    logger.error(f"Redis MGET error: {e}")
+                    span.record_exception(e)
+                    return [default] * len(keys)
+
+                results = []
+                for value in values:
+                    if value is None:
+                        CACHE_MISSES.labels('mget').inc()
+                        results.append(default)
+                        continue
+                    CACHE_HITS.labels('mget').inc()
+                    try:
+                        results.append(orjson.loads(value))
+                    except orjson.JSONDecodeError:
+                        results.append(value)
+                return results
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """Set multiple values in Redis using a single pipeline.
+
+        Args:
+            mapping: Keys and values to set
+            ttl: Optional TTL in seconds applied to every key
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with tracer.start_as_current_span('redis.set_many') as span:
+            span.set_attribute('redis.key_count', len(mapping))
+
+            with OPERATION_LATENCY.labels('set_many').time():
+                try:
+                    pipe = self.client.pipeline(transaction=False)
+                    for key, value in mapping.items():
+                        if not isinstance(value, (str, bytes)):
+                            value = orjson.dumps(
+                                value,
+                                option=orjson.OPT_NON_STR_KEYS
+                            )
+                        if ttl is not None:
+                            pipe.setex(key, ttl, value)
+                        else:
+                            pipe.set(key, value)
+                    return all(pipe.execute())
+
+                except Exception as e:
+                    logger.error(f"Redis pipeline SET error: {e}")
+                    span.record_exception(e)
+                    return False
+
     async def delete(self, key: str) -> bool:
         """Delete key from Redis.
         
@@ -4,6 +4,7 @@ Base integration class for external services.
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
+import aiohttp
 from ..tools.rest_tool import RESTTool
 from ..monitoring.tracing import TracingManager
 from ..monitoring.logging import StructuredLogger
@@ -11,14 +12,15 @@ from ..monitoring.logging import StructuredLogger
 class BaseIntegration(ABC):
     """Base class for all external service integrations."""
     
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the integration.
         
         Args:
             api_token: Authentication token for the service
+            session: Optional shared HTTP session to reuse connections
         """
         self.api_token = api_token
-        self.rest_tool = RESTTool(timeout=30)
+        self.rest_tool = RESTTool(timeout=30, session=session)
         self.logger = StructuredLogger(__name__)
         self.tracer = TracingManager(__name__)
     
@@ -3,6 +3,7 @@ GitHub API integration for Agent360.
 """
 
 from typing import Dict, Any, List, Optional
+import aiohttp
 from .base import BaseIntegration
 
 class GitHubIntegration(BaseIntegration):
@@ -10,13 +11,14 @@ class GitHubIntegration(BaseIntegration):
     
     BASE_URL = "https://api.github.com"
     
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, session: Optional[aiohttp.ClientSession] = None):
         """Initialize GitHub integration.
         
         Args:
             api_token: GitHub API token
+            session: Optional shared HTTP session
         """
-        super().__init__(api_token)
+        super().__init__(api_token, session=session)
     
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get GitHub authentication headers."""
@@ -3,12 +3,15 @@ Integration Manager for Agent360.
 Handles integration lifecycle and configuration.
 """
 import asyncio
-import json
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
 
+import orjson
 from opentelemetry import trace
 from prometheus_client import Counter, Histogram
 
@@ -31,9 +34,82 @@ INTEGRATION_LATENCY = Histogram(
     ['integration_type', 'operation']
 )
 
-@dataclass
+_INSERT_INTEGRATION_QUERY = """
+    INSERT INTO integrations (
+        integration_type,
+        config,
+        enabled,
+        retry_policy,
+        timeout_seconds,
+        cache_ttl_seconds,
+        created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_CACHE_KEY_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _encode_cache_param(value: Any) -> Any:
+    """Normalize a parameter value orjson has no native encoding for.
+    
+    Args:
+        value: Parameter value
+        
+    Returns:
+        Sets as lists in a stable order
+        
+    Raises:
+        TypeError: If the value has no stable encoding
+    """
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=lambda item: orjson.dumps(
+            item,
+            default=_encode_cache_param,
+            option=_CACHE_KEY_OPTIONS
+        ))
+    raise TypeError(f"Unsupported cache parameter type: {type(value).__name__}")
+
+
+def make_cache_key(
+    integration_type: str,
+    operation: str,
+    params: Dict[str, Any]
+) -> str:
+    """Get the Redis key for an integration result.
+    
+    Parameters are serialized in sorted-key order, so equal dicts map to
+    the same key regardless of insertion order, and sets are sorted.
+    Values with no stable encoding are rejected rather than keyed by
+    repr, which could collide or change between runs.
+    
+    Args:
+        integration_type: Integration type
+        operation: Operation name
+        params: Operation parameters
+        
+    Returns:
+        Cache key
+        
+    Raises:
+        TypeError: If a parameter cannot be encoded
+    """
+    try:
+        encoded = orjson.dumps(
+            params,
+            default=_encode_cache_param,
+            option=_CACHE_KEY_OPTIONS
+        ).decode()
+    except orjson.JSONEncodeError as e:
+        raise TypeError(f"Cannot build cache key from params: {e}") from e
+    return f"integration:{integration_type}:{operation}:{encoded}"
+
+@dataclass(frozen=True, slots=True)
 class IntegrationConfig:
-    """Integration configuration."""
+    """Integration configuration.
+    
+    Immutable and slotted: updates build a new instance, and the registry
+    holds no per-instance __dict__.
+    """
     integration_type: str
     config: Dict[str, Any]
     enabled: bool = True
@@ -44,11 +120,12 @@ class IntegrationConfig:
 class IntegrationManager:
     """Manages integration lifecycle and configuration."""
     
-    def __init__(
-        self,
-        cassandra: DatabaseConnection,
-        redis: RedisClient
-    ):
+    # In-process results cache in front of Redis; entries live for the
+    # integration's cache TTL capped at L1_CACHE_TTL seconds
+    L1_CACHE_SIZE = 4096
+    L1_CACHE_TTL = 5.0
+    
+    def __init__(self, cassandra: DatabaseConnection, redis: RedisClient):
         """Initialize integration manager.
         
         Args:
@@ -58,7 +135,26 @@ class IntegrationManager:
         self.cassandra = cassandra
         self.redis = redis
         self._integrations: Dict[str, IntegrationConfig] = {}
+        self._pending_gets: Dict[str, asyncio.Future] = {}
+        self._pending_sets: Dict[str, Tuple[bytes, int, asyncio.Future]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._stmts: Dict[str, Any] = {}
+        self._l1: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
         
+    async def _prepared(self, query: str) -> Any:
+        """Get a prepared statement for a query, preparing it on first use.
+        
+        Args:
+            query: Query text
+            
+        Returns:
+            Prepared statement reused for every later call with this text
+        """
+        stmt = self._stmts.get(query)
+        if stmt is None:
+            stmt = self._stmts[query] = await self.cassandra.prepare(query)
+        return stmt
+
     def _validate_config(self, config: Any) -> None:
         """Validate integration configuration.
         
@@ -101,13 +197,170 @@ class IntegrationManager:
         if cache_ttl <= 0:
             raise ValueError("Cache TTL must be positive")
             
+    def _l1_get(self, key: str) -> Any:
+        """Get a result from the in-process cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached result, or None if absent or expired
+        """
+        cached = self._l1.get(key)
+        if cached is None:
+            return None
+        expires_at, value = cached
+        if time.monotonic() < expires_at:
+            self._l1.move_to_end(key)
+            return value
+        del self._l1[key]
+        return None
+
+    def _l1_set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a result in the in-process cache, evicting the oldest entry when full.
+        
+        Args:
+            key: Cache key
+            value: Decoded result
+            ttl: Integration cache TTL in seconds
+        """
+        self._l1[key] = (time.monotonic() + min(ttl, self.L1_CACHE_TTL), value)
+        self._l1.move_to_end(key)
+        if len(self._l1) > self.L1_CACHE_SIZE:
+            self._l1.popitem(last=False)
+
+    def _schedule_cache_flush(self) -> None:
+        """Start the cache flusher if one is not already pending."""
+        if self._flush_task is None or self._flush_task.done():
+            self._start_cache_flush()
+
+    def _start_cache_flush(self) -> None:
+        """Start a cache flusher task."""
+        self._flush_task = asyncio.create_task(self._flush_cache())
+        self._flush_task.add_done_callback(self._cache_flush_done)
+
+    def _cache_flush_done(self, task: asyncio.Task) -> None:
+        """Cancel queued cache requests if their flusher died.
+        
+        No later flush is scheduled for them otherwise, e.g. when the
+        flusher is cancelled at shutdown, possibly before it even starts.
+        
+        Args:
+            task: Finished flusher task
+        """
+        if task is not self._flush_task:
+            return  # A newer flusher already owns the queue
+        if task.cancelled() or task.exception() is not None:
+            self._cancel_cache_requests(self._pending_gets, self._pending_sets)
+            self._pending_gets, self._pending_sets = {}, {}
+
+    async def _cache_get(self, key: str) -> Any:
+        """Queue a cache read to be served by the next batched MGET.
+        
+        Args:
+            key: Cache key to read
+            
+        Returns:
+            Cached value, or None on a miss
+        """
+        future = self._pending_gets.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending_gets[key] = future
+            self._schedule_cache_flush()
+        # Shielded so one caller being cancelled (e.g. by its timeout)
+        # does not cancel the read for every caller sharing it
+        return await asyncio.shield(future)
+
+    async def _cache_set(self, key: str, value: bytes, ttl: int) -> None:
+        """Queue a cache write to be sent with the next pipelined batch.
+        
+        Args:
+            key: Cache key to write
+            value: JSON-encoded value
+            ttl: TTL in seconds
+        """
+        future = asyncio.get_running_loop().create_future()
+        previous = self._pending_sets.get(key)
+        self._pending_sets[key] = (value, ttl, future)
+        self._schedule_cache_flush()
+        if previous is not None and not previous[2].done():
+            previous[2].set_result(None)
+        await future
+
+    @staticmethod
+    def _cancel_cache_requests(
+        gets: Dict[str, asyncio.Future],
+        sets: Dict[str, Tuple[bytes, int, asyncio.Future]]
+    ) -> None:
+        """Cancel every unresolved cache read and write so no caller hangs.
+        
+        Args:
+            gets: Queued reads by key
+            sets: Queued writes by key
+        """
+        for future in itertools.chain(
+            gets.values(),
+            (future for _, _, future in sets.values())
+        ):
+            if not future.done():
+                future.cancel()
+
+    async def _flush_cache(self) -> None:
+        """Flush queued cache reads with one MGET and writes with one pipeline per TTL.
+        
+        There is no batching timer: the flusher runs on the loop's next
+        pass, so a batch holds whatever callers queued up to then and a
+        lone request goes out without delay.
+        """
+        gets: Dict[str, asyncio.Future] = {}
+        sets: Dict[str, Tuple[bytes, int, asyncio.Future]] = {}
+        try:
+            gets, self._pending_gets = self._pending_gets, {}
+            sets, self._pending_sets = self._pending_sets, {}
+
+            if gets:
+                try:
+                    values = await self.redis.mget(list(gets))
+                except Exception as e:
+                    logger.error(f"Batched cache read failed: {e}")
+                    values = [None] * len(gets)
+                for future, value in zip(gets.values(), values):
+                    if not future.done():
+                        future.set_result(value)
+
+            if sets:
+                by_ttl: Dict[int, Dict[str, str]] = {}
+                for key, (value, ttl, _) in sets.items():
+                    by_ttl.setdefault(ttl, {})[key] = value
+                try:
+                    await asyncio.gather(*(
+                        self.redis.set_many(mapping, ttl=ttl)
+                        for ttl, mapping in by_ttl.items()
+                    ))
+                except Exception as e:
+                    logger.error(f"Batched cache write failed: {e}")
+                for _, _, future in sets.values():
+                    if not future.done():
+                        future.set_result(None)
+        finally:
+            self._cancel_cache_requests(gets, sets)
+
+        # Requests queued while this batch was in flight get their own flush
+        if self._pending_gets or self._pending_sets:
+            self._start_cache_flush()
+
     async def _clear_integration_cache(self, integration_type: str) -> None:
         """Clear all cached results for an integration.
         
         Args:
             integration_type: Integration type to clear cache for
         """
-        pattern = f"integration:{integration_type}:*"
+        prefix = f"integration:{integration_type}:"
+        for key in [key for key in self._l1 if key.startswith(prefix)]:
+            del self._l1[key]
+        
+        pattern = prefix + "*"
         keys = await self.redis.keys(pattern)
         if keys:
             await asyncio.gather(*[self.redis.delete(key) for key in keys])
@@ -116,7 +369,7 @@ class IntegrationManager:
         """Initialize integration manager."""
         # Load integrations from database
         query = "SELECT * FROM integrations"
-        result = await self.cassandra.execute(query)
+        result = await self.cassandra.execute_in_executor(query)
         
         for row in result:
             self._integrations[row['integration_type']] = IntegrationConfig(
@@ -181,19 +434,8 @@ class IntegrationManager:
         )
         
         # Save to database
-        query = """
-            INSERT INTO integrations (
-                integration_type,
-                config,
-                enabled,
-                retry_policy,
-                timeout_seconds,
-                cache_ttl_seconds,
-                created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """
-        await self.cassandra.execute(
-            query,
+        await self.cassandra.execute_in_executor(
+            await self._prepared(_INSERT_INTEGRATION_QUERY),
             (
                 integration.integration_type,
                 integration.config,
@@ -215,6 +457,51 @@ class IntegrationManager:
             cache_ttl_seconds=cache_ttl_seconds
         )
 
+    async def register_integrations(
+        self,
+        integrations: List[IntegrationConfig]
+    ):
+        """Register several integrations with a single database round trip.
+        
+        Args:
+            integrations: Integration configurations to register
+            
+        The local registry only changes once the batch write succeeds.
+        
+        Raises:
+            ValueError: If any configuration is invalid
+            Exception: If the batch write fails, leaving the registry unchanged
+        """
+        # Validate everything before writing anything
+        for integration in integrations:
+            self._validate_config(integration.config)
+            self._validate_retry_policy(integration.retry_policy)
+            self._validate_timeouts(
+                integration.timeout_seconds,
+                integration.cache_ttl_seconds
+            )
+        
+        created_at = datetime.utcnow()
+        await self.cassandra.execute_many(
+            await self._prepared(_INSERT_INTEGRATION_QUERY),
+            [
+                (
+                    integration.integration_type,
+                    integration.config,
+                    integration.enabled,
+                    integration.retry_policy,
+                    integration.timeout_seconds,
+                    integration.cache_ttl_seconds,
+                    created_at
+                )
+                for integration in integrations
+            ]
+        )
+        
+        # Update local cache now that every row is stored
+        for integration in integrations:
+            self._integrations[integration.integration_type] = integration
+
     async def update_integration(
         self,
         integration_type: str,
@@ -237,10 +524,10 @@ class IntegrationManager:
         Raises:
             ValueError: If integration not found or configuration invalid
         """
-        integration = await self.get_integration(integration_type)
+        integration = self._integrations.get(integration_type)
         if not integration:
             raise ValueError(f"Integration {integration_type} not found")
-            
+        
         # Validate new values
         if config is not None:
             self._validate_config(config)
@@ -251,50 +538,40 @@ class IntegrationManager:
                 timeout_seconds or integration.timeout_seconds,
                 cache_ttl_seconds or integration.cache_ttl_seconds
             )
-            
+        
         # Build update query
-        updates = []
-        params = []
+        changes: Dict[str, Any] = {}
         if config is not None:
-            updates.append("config = ?")
-            params.append(config)
+            changes["config"] = config
         if enabled is not None:
-            updates.append("enabled = ?")
-            params.append(enabled)
+            changes["enabled"] = enabled
         if retry_policy is not None:
-            updates.append("retry_policy = ?")
-            params.append(retry_policy)
+            changes["retry_policy"] = retry_policy
         if timeout_seconds is not None:
-            updates.append("timeout_seconds = ?")
-            params.append(timeout_seconds)
+            changes["timeout_seconds"] = timeout_seconds
         if cache_ttl_seconds is not None:
-            updates.append("cache_ttl_seconds = ?")
-            params.append(cache_ttl_seconds)
-            
-        if not updates:
+            changes["cache_ttl_seconds"] = cache_ttl_seconds
+        
+        if not changes:
             return
-            
+        
         # Update database
         query = f"""
             UPDATE integrations
-            SET {', '.join(updates)}
+            SET {', '.join(f"{column} = ?" for column in changes)}
             WHERE integration_type = ?
         """
-        params.append(integration_type)
-        await self.cassandra.execute(query, params)
+        params = [*changes.values(), integration_type]
+        await self.cassandra.execute_in_executor(await self._prepared(query), params)
         
         # Clear cache
         await self._clear_integration_cache(integration_type)
         
-        # Update local cache
-        self._integrations[integration_type] = IntegrationConfig(
-            integration_type=integration_type,
-            config=config if config is not None else integration.config,
-            enabled=enabled if enabled is not None else integration.enabled,
-            retry_policy=retry_policy if retry_policy is not None else integration.retry_policy,
-            timeout_seconds=timeout_seconds if timeout_seconds is not None else integration.timeout_seconds,
-            cache_ttl_seconds=cache_ttl_seconds if cache_ttl_seconds is not None else integration.cache_ttl_seconds
-        )
+        # Update local cache, applying the changes to whatever entry is
+        # current now rather than the one read before the database write
+        current = self._integrations.get(integration_type)
+        if current is not None:
+            self._integrations[integration_type] = replace(current, **changes)
 
     async def delete_integration(self, integration_type: str):
         """Delete integration.
@@ -304,13 +581,13 @@ class IntegrationManager:
         """
         if integration_type not in self._integrations:
             raise ValueError(f"Integration {integration_type} not found")
-            
+        
         # Delete from database
         query = "DELETE FROM integrations WHERE integration_type = ?"
-        await self.cassandra.execute(query, (integration_type,))
+        await self.cassandra.execute_in_executor(await self._prepared(query), (integration_type,))
         
         # Remove from local cache
-        del self._integrations[integration_type]
+        self._integrations.pop(integration_type, None)
         
         # Clear cache
         await self._clear_integration_cache(integration_type)
@@ -329,10 +606,12 @@ class IntegrationManager:
             params: Operation parameters
             
         Returns:
-            Operation result
+            Operation result; results served from the in-process cache
+            are shared between callers and must not be mutated
             
         Raises:
             ValueError: If integration not found or disabled
+            TypeError: If params cannot be encoded into a cache key
             TimeoutError: If operation times out
         """
         integration = await self.get_integration(integration_type)
@@ -342,26 +621,31 @@ class IntegrationManager:
         if not integration.enabled:
             raise ValueError(f"Integration {integration_type} is disabled")
             
-        # Check cache
-        cache_key = f"integration:{integration_type}:{operation}:{str(params)}"
-        cached = await self.redis.get(cache_key)
-        if cached:
-            return json.loads(cached)
+        # Check the in-process cache, then Redis
+        cache_key = make_cache_key(integration_type, operation, params)
+        cached = self._l1_get(cache_key)
+        if cached is not None:
+            return cached
+        # RedisClient already decodes the JSON; falsy results are still hits
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            self._l1_set(cache_key, cached, integration.cache_ttl_seconds)
+            return cached
             
         # Execute with timeout
         try:
-            result = await asyncio.wait_for(
-                self._execute_operation(integration, operation, params),
-                timeout=integration.timeout_seconds
-            )
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(integration.timeout_seconds):
+                result = await self._execute_operation(integration, operation, params)
+        except TimeoutError:
             raise TimeoutError(f"Operation timed out after {integration.timeout_seconds} seconds")
         
-        # Cache result
-        await self.redis.set(
+        # Cache result; encoded here because RedisClient stores str values
+        # as-is, and a str result would not decode back to itself
+        self._l1_set(cache_key, result, integration.cache_ttl_seconds)
+        await self._cache_set(
             cache_key,
-            json.dumps(result),
-            ex=integration.cache_ttl_seconds
+            orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS),
+            integration.cache_ttl_seconds
         )
         
         return result
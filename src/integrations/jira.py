@@ -3,19 +3,22 @@ Jira API integration for Agent360.
 """
 
 from typing import Dict, Any, List, Optional
+import aiohttp
 from .base import BaseIntegration
 
 class JiraIntegration(BaseIntegration):
     """Integration with Jira API."""
     
-    def __init__(self, api_token: str, domain: str):
+    def __init__(self, api_token: str, domain: str,
+                 session: Optional[aiohttp.ClientSession] = None):
         """Initialize Jira integration.
         
         Args:
             api_token: Jira API token
             domain: Jira domain (e.g., 'your-domain.atlassian.net')
+            session: Optional shared HTTP session
         """
-        super().__init__(api_token)
+        super().__init__(api_token, session=session)
         self.base_url = f"https://{domain}/rest/api/3"
     
     def _get_auth_headers(self) -> Dict[str, str]:
@@ -3,18 +3,20 @@ Slack webhook integration for Agent360.
 """
 
 from typing import Dict, Any, List, Optional, Union
+import aiohttp
 from .base import BaseIntegration
 
 class SlackIntegration(BaseIntegration):
     """Integration with Slack webhooks."""
     
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, session: Optional[aiohttp.ClientSession] = None):
         """Initialize Slack integration.
         
         Args:
             webhook_url: Slack webhook URL
+            session: Optional shared HTTP session
         """
-        super().__init__("")  # No API token needed for webhooks
+        super().__init__("", session=session)  # No API token needed for webhooks
         self.webhook_url = webhook_url
     
     def _get_auth_headers(self) -> Dict[str, str]:
@@ -13,7 +13,14 @@ logger = logging.getLogger(__name__)
 class RESTTool(BaseTool):
     """Tool for making REST API calls with monitoring and retry logic."""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize REST tool.
+        
+        Args:
+            timeout: Request timeout in seconds
+            session: Optional shared aiohttp session; the caller keeps
+                ownership and is responsible for closing it
+        """
         metadata = ToolMetadata(
             name="rest_tool",
             description="Execute REST API calls with monitoring and retry logic",
@@ -29,12 +36,14 @@ class RESTTool(BaseTool):
         )
         super().__init__(metadata)
         self.timeout = timeout
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
         
     async def _ensure_session(self):
         """Ensure aiohttp session exists."""
         if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._owns_session = True
     
     @backoff.on_exception(
         backoff.expo,
@@ -74,7 +83,8 @@ class RESTTool(BaseTool):
                 url=url,
                 headers=headers,
                 json=data,
-                params=params
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
             ) as response:
                 body = await response.json()
                 result = {
@@ -94,5 +104,5 @@ class RESTTool(BaseTool):
             
     async def cleanup(self):
         """Cleanup resources."""
-        if self.session and not self.session.closed:
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
@@ -1,6 +1,7 @@
 """
 Agent workflow implementation with core principles and infrastructure integration.
 """
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
@@ -32,6 +33,14 @@ WORKFLOW_LATENCY = Histogram(
     ['step']
 )
 
+# Shared by every workflow instance; never mutated
+ACTIVITY_RETRY_POLICY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=5),
+    maximum_attempts=5
+)
+
 @workflow.defn
 class AgentWorkflow:
     """Agent workflow implementation."""
@@ -39,12 +48,7 @@ class AgentWorkflow:
     def __init__(self):
         self._state = None
         self._context = None
-        self._retry_policy = RetryPolicy(
-            initial_interval=1,
-            backoff_coefficient=2.0,
-            maximum_interval=5,
-            maximum_attempts=5
-        )
+        self._retry_policy = ACTIVITY_RETRY_POLICY
     
     @workflow.run
     async def run(self, context: AgentContext) -> Dict[str, Any]:
@@ -60,11 +64,11 @@ class AgentWorkflow:
             self._context = context
             self._state = context.state
             
-            # Initialize workflow
+            # Record each step before running it, so a failed state
+            # write stops the step and no stale write can land later
             self._state.current_step = 'reasoning'
             await self._update_state()
             
-            # Execute reasoning
             reasoning_result = await self._execute_reasoning()
             
             # Execute selected tool
@@ -195,10 +199,15 @@ class AgentWorkflow:
                 raise
     
     async def _update_state(self):
-        """Update workflow state."""
+        """Update workflow state.
+        
+        Runs as a local activity: the write is short and issued at every
+        step, so it stays in the worker instead of round-tripping through
+        the Temporal server's task queue.
+        """
         with WORKFLOW_LATENCY.labels('state_update').time():
             try:
-                result = await workflow.execute_activity(
+                result = await workflow.execute_local_activity(
                     update_state,
                     self._state,
                     retry_policy=self._retry_policy,
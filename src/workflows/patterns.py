@@ -2,8 +2,10 @@
 Workflow patterns and execution strategies.
 """
 
+import json
 import logging
-from typing import Dict, Any, List, Optional, Callable
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Tuple, Union
 from datetime import datetime
 from uuid import UUID
 import asyncio
@@ -15,12 +17,18 @@ from prometheus_client import Counter, Histogram
 
 from ..agent_runtime.context import AgentContext, AgentState
 from ..agent_runtime.reasoning import ReasoningEngine, Memory
-from ..infrastructure.event_store import EventStore
+from ..infrastructure.event_store import EventBuffer, EventStore
+from ..infrastructure.memory_client import MemoryClient
+from ..infrastructure.model_client import ModelClient
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
 # Metrics
+#
+# Label values must stay bounded: never label these by tenant_id,
+# workflow_id or agent_id. Per-tenant visibility belongs in a separate
+# metric aggregated by tenant class, not tenant ID.
 PATTERN_OPERATIONS = Counter(
     'workflow_pattern_operations_total',
     'Total number of workflow pattern operations',
@@ -31,10 +39,21 @@ PATTERN_LATENCY = Histogram(
     'Workflow pattern operation latency',
     ['pattern', 'operation']
 )
+# Unit is reasoning steps: each answer, reflection or parallel approach
+# counts as one step, whether it took its own call or not
+PATTERN_STEPS = Histogram(
+    'workflow_pattern_steps',
+    'Reasoning steps (answers, reflections or parallel approaches) per pattern execution',
+    ['pattern'],
+    buckets=(1, 2, 4, 8, 16, 32, 64)
+)
 
 class WorkflowPattern:
     """Base class for workflow execution patterns."""
     
+    # Pattern name used as the metrics label
+    name = "pattern"
+    
     def __init__(self, reasoning_engine: ReasoningEngine):
         """Initialize pattern.
         
@@ -42,6 +61,13 @@ class WorkflowPattern:
             reasoning_engine: Reasoning engine
         """
         self.reasoning = reasoning_engine
+        
+        # Bind metric children once; the pattern label is fixed per class
+        self._m_executed = PATTERN_OPERATIONS.labels(
+            pattern=self.name,
+            operation="execute"
+        )
+        self._m_steps = PATTERN_STEPS.labels(pattern=self.name)
     
     async def execute(
         self,
@@ -62,6 +88,8 @@ class WorkflowPattern:
 class ChainOfThought(WorkflowPattern):
     """Chain of thought reasoning pattern."""
     
+    name = "chain_of_thought"
+    
     async def execute(
         self,
         context: AgentContext,
@@ -100,7 +128,7 @@ class ChainOfThought(WorkflowPattern):
                     ],
                     prompt="Reflect on the reasoning process and identify potential improvements."
                 )
-                .
+                
                 # Final response
                 response = {
                     "reasoning": result,
@@ -108,10 +136,8 @@ class ChainOfThought(WorkflowPattern):
                     "final_answer": result.get("response", "")
                 }
                 
-                PATTERN_OPERATIONS.labels(
-                    pattern="chain_of_thought",
-                    operation="execute"
-                ).inc()
+                self._m_executed.inc()
+                self._m_steps.observe(2)
                 
                 return response
                 
@@ -124,6 +150,37 @@ class ChainOfThought(WorkflowPattern):
 class ReflectiveExecution(WorkflowPattern):
     """Reflective execution pattern."""
     
+    name = "reflective_execution"
+    
+    SINGLE_PASS_TEMPLATE = (
+        "{prompt}\n\n"
+        "Answer the task above, then reflect on your answer and revise it. "
+        "Repeat the reflect-and-revise step up to {max_iterations} times, "
+        "stopping early once no further improvement is needed. Respond "
+        "only with JSON of the form "
+        '{{"iterations": <int>, "results": [<answer per iteration>], '
+        '"reflections": [<reflection that led to each revision>], '
+        '"final_result": <final answer>}}.'
+    )
+    
+    def __init__(
+        self,
+        reasoning_engine: ReasoningEngine,
+        max_iterations: int = 3,
+        single_pass: bool = False
+    ):
+        """Initialize pattern.
+        
+        Args:
+            reasoning_engine: Reasoning engine
+            max_iterations: Maximum number of reflection steps
+            single_pass: Ask the model to reflect and revise within one
+                structured call instead of one call per step
+        """
+        super().__init__(reasoning_engine)
+        self.max_iterations = max_iterations
+        self.single_pass = single_pass
+    
     async def execute(
         self,
         context: AgentContext,
@@ -142,6 +199,16 @@ class ReflectiveExecution(WorkflowPattern):
             span.set_attribute("context.tenant_id", context.state.tenant_id)
             
             try:
+                if self.single_pass:
+                    response = await self._execute_single_pass(context, prompt)
+                    if response is not None:
+                        return response
+                    # Provider did not return usable structured output
+                    logger.warning(
+                        "Single-pass reflection unavailable, "
+                        "falling back to iterative execution"
+                    )
+                
                 # Initial execution
                 result = await self.reasoning.reason(
                     agent_id=context.state.id,
@@ -153,7 +220,7 @@ class ReflectiveExecution(WorkflowPattern):
                 reflections = []
                 current_result = result
                 
-                for i in range(3):  # 3 reflection steps
+                for i in range(self.max_iterations):
                     reflection = await self.reasoning.reflect(
                         agent_id=context.state.id,
                         memories=[
@@ -184,10 +251,8 @@ class ReflectiveExecution(WorkflowPattern):
                     "final_result": current_result
                 }
                 
-                PATTERN_OPERATIONS.labels(
-                    pattern="reflective_execution",
-                    operation="execute"
-                ).inc()
+                self._m_executed.inc()
+                self._m_steps.observe(1 + 2 * len(reflections))
                 
                 return response
                 
@@ -196,10 +261,66 @@ class ReflectiveExecution(WorkflowPattern):
                 span.set_status(Status(StatusCode.ERROR))
                 span.record_exception(e)
                 raise
+    
+    async def _execute_single_pass(
+        self,
+        context: AgentContext,
+        prompt: str
+    ) -> Optional[Dict[str, Any]]:
+        """Execute the reflect-and-revise loop in a single model call.
+        
+        Args:
+            context: Agent context
+            prompt: Execution prompt
+            
+        Returns:
+            Execution result with reflection, or None if the model output
+            could not be parsed
+        """
+        result = await self.reasoning.reason(
+            agent_id=context.state.id,
+            context={"prompt": prompt, "mode": "single_pass_reflection"},
+            prompt=self.SINGLE_PASS_TEMPLATE.format(
+                prompt=prompt,
+                max_iterations=self.max_iterations
+            )
+        )
+        
+        output = result
+        if "final_result" not in output:
+            try:
+                output = json.loads(result.get("response", ""))
+            except (TypeError, ValueError):
+                return None
+            if not isinstance(output, dict) or "final_result" not in output:
+                return None
+        
+        results = output.get("results")
+        if not isinstance(results, list):
+            results = []
+        reflections = output.get("reflections")
+        if not isinstance(reflections, list):
+            reflections = []
+        
+        # Model-reported answer count; fall back to the answers actually returned
+        iterations = output.get("iterations")
+        if isinstance(iterations, bool) or not isinstance(iterations, int) or iterations < 0:
+            iterations = len(results)
+        
+        self._m_executed.inc()
+        self._m_steps.observe(iterations + len(reflections))
+        
+        return {
+            "initial_result": results[0] if results else output["final_result"],
+            "reflections": reflections,
+            "final_result": output["final_result"]
+        }
 
 class ParallelReasoning(WorkflowPattern):
     """Parallel reasoning pattern."""
     
+    name = "parallel_reasoning"
+    
     def __init__(
         self,
         reasoning_engine: ReasoningEngine,
@@ -234,11 +355,14 @@ class ParallelReasoning(WorkflowPattern):
         if not self.approaches:
             raise ValueError("No reasoning approaches provided")
 
-        tasks = []
-        for approach in self.approaches:
-            tasks.append(self._execute_approach(approach, context))
-            
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Failures are returned rather than raised, so one failing approach
+        # never cancels its siblings in the group
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(self._execute_approach(approach, context))
+                for approach in self.approaches
+            ]
+        results = [task.result() for task in tasks]
         
         # Filter out errors
         valid_results = []
@@ -250,6 +374,8 @@ class ParallelReasoning(WorkflowPattern):
                 
         if not valid_results:
             raise ValueError("All reasoning approaches failed")
+        
+        self._m_steps.observe(len(results))
             
         return await self._combine_results(valid_results)
         
@@ -257,7 +383,7 @@ class ParallelReasoning(WorkflowPattern):
         self,
         approach: Callable,
         context: AgentContext
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], Exception]:
         """Execute a single approach.
         
         Args:
@@ -265,13 +391,13 @@ class ParallelReasoning(WorkflowPattern):
             context: Agent context
             
         Returns:
-            Approach result
+            Approach result, or the exception the approach raised
         """
         try:
             return await approach(context)
         except Exception as e:
             logger.error(f"Approach failed: {str(e)}")
-            raise
+            return e
 
     async def _combine_results(
         self,
@@ -300,6 +426,9 @@ class ParallelReasoning(WorkflowPattern):
 class WorkflowPatterns:
     """Factory for workflow execution patterns."""
     
+    # Maximum number of cached parallel reasoning patterns
+    MAX_CACHED_PATTERNS = 128
+    
     def __init__(
         self,
         reasoning_engine: ReasoningEngine,
@@ -313,6 +442,31 @@ class WorkflowPatterns:
         """
         self.reasoning = reasoning_engine
         self.events = event_store
+        self._event_buffer = EventBuffer(event_store)
+        self._chain_of_thought: Optional[ChainOfThought] = None
+        self._reflective_execution: Optional[ReflectiveExecution] = None
+        self._parallel_cache: OrderedDict[
+            Tuple[Callable, ...], ParallelReasoning
+        ] = OrderedDict()
+    
+    @classmethod
+    def from_clients(
+        cls,
+        model_client: ModelClient,
+        memory_client: MemoryClient,
+        event_store: EventStore
+    ) -> 'WorkflowPatterns':
+        """Create a factory sharing one reasoning engine across patterns.
+        
+        Args:
+            model_client: Model client for LLM inference
+            memory_client: Memory client for persistence
+            event_store: Event store
+            
+        Returns:
+            WorkflowPatterns factory
+        """
+        return cls(ReasoningEngine(model_client, memory_client), event_store)
     
     def chain_of_thought(self) -> ChainOfThought:
         """Get chain of thought pattern.
@@ -320,7 +474,9 @@ class WorkflowPatterns:
         Returns:
             ChainOfThought pattern
         """
-        return ChainOfThought(self.reasoning)
+        if self._chain_of_thought is None:
+            self._chain_of_thought = ChainOfThought(self.reasoning)
+        return self._chain_of_thought
     
     def reflective_execution(self) -> ReflectiveExecution:
         """Get reflective execution pattern.
@@ -328,7 +484,9 @@ class WorkflowPatterns:
         Returns:
             ReflectiveExecution pattern
         """
-        return ReflectiveExecution(self.reasoning)
+        if self._reflective_execution is None:
+            self._reflective_execution = ReflectiveExecution(self.reasoning)
+        return self._reflective_execution
     
     def parallel_reasoning(
         self,
@@ -341,8 +499,21 @@ class WorkflowPatterns:
             
         Returns:
             ParallelReasoning pattern
+        
+        Patterns are cached per approach set (least recently used are
+        evicted), so approaches must not close over per-call state.
         """
-        return ParallelReasoning(self.reasoning, approaches)
+        key = tuple(approaches)
+        pattern = self._parallel_cache.get(key)
+        if pattern is not None:
+            self._parallel_cache.move_to_end(key)
+            return pattern
+        
+        pattern = ParallelReasoning(self.reasoning, list(approaches))
+        self._parallel_cache[key] = pattern
+        if len(self._parallel_cache) > self.MAX_CACHED_PATTERNS:
+            self._parallel_cache.popitem(last=False)
+        return pattern
     
     async def record_pattern_execution(
         self,
@@ -350,16 +521,23 @@ class WorkflowPatterns:
         pattern_name: str,
         context: AgentContext,
         result: Dict[str, Any]
-    ) -> None:
-        """Record pattern execution event.
+    ) -> asyncio.Future:
+        """Queue a pattern execution event for storage.
+        
+        The event is not guaranteed to be saved until the returned future
+        resolves; await it to learn whether its batch was stored.
         
         Args:
             workflow_id: Workflow ID
             pattern_name: Name of pattern
             context: Execution context
             result: Execution result
+            
+        Returns:
+            Future resolving to the event ID once it is stored, or raising
+            the error that stopped it from being stored
         """
-        await self.events.store_event(
+        return await self._event_buffer.put(
             workflow_id=workflow_id,
             event_type="pattern_execution",
             event_data={
@@ -371,3 +549,11 @@ class WorkflowPatterns:
                 "result": result
             }
         )
+    
+    async def flush_events(self) -> None:
+        """Wait until every queued pattern execution event has been written or has failed."""
+        await self._event_buffer.flush()
+    
+    async def close(self) -> None:
+        """Flush queued events and stop the background writer."""
+        await self._event_buffer.close()
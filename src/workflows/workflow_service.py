@@ -5,22 +5,74 @@ import logging
 from typing import Dict, Any, List, Optional
 from uuid import uuid4, UUID
 
-from src.infrastructure.event_store import EventStore
+from src.infrastructure.event_store import EventBuffer, EventStore
 
 logger = logging.getLogger(__name__)
 
 class WorkflowService:
     """Service for managing workflows."""
 
-    def __init__(self, db, event_store=None):
+    def __init__(self, db, event_store=None, health_check_interval: float = 5.0):
         """Initialize workflow service.
         
         Args:
             db: Database connection
             event_store: Event store
+            health_check_interval: Seconds between background database probes
         """
         self.db = db
         self.event_store = event_store or EventStore()
+        self.health_check_interval = health_check_interval
+        self._db_healthy = False
+        self._health_task: Optional[asyncio.Task] = None
+        self._first_probe: Optional[asyncio.Task] = None
+        # Concurrent event writes share one batched round trip
+        self._event_queue = EventBuffer(self.event_store)
+
+    async def _check_health(self) -> None:
+        """Probe the database and record its health.
+
+        Raises:
+            Exception: If the probe fails
+        """
+        try:
+            await self.db.execute("SELECT 1")
+            self._db_healthy = True
+        except Exception:
+            self._db_healthy = False
+            raise
+
+    async def _health_loop(self) -> None:
+        """Periodically probe the database in the background."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self._check_health()
+            except Exception as e:
+                logger.error(f"Database health check failed: {str(e)}")
+
+    async def flush_events(self) -> None:
+        """Wait until every queued workflow event has been written or has failed."""
+        await self._event_queue.flush()
+
+    async def close(self) -> None:
+        """Flush queued events and stop the background tasks."""
+        try:
+            await self._event_queue.close()
+        finally:
+            await self._stop_health_check()
+
+    async def _stop_health_check(self) -> None:
+        """Stop the background health check."""
+        for task in (self._first_probe, self._health_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._first_probe = None
+        self._health_task = None
 
     async def execute_workflow(self, workflow_id: str, user_id: str) -> Dict[str, Any]:
         """Execute a workflow.
@@ -33,12 +85,22 @@ class WorkflowService:
             Dict containing execution details
         """
         try:
-            await self.db.execute("SELECT 1")  # Test database connection
+            # Probe once up front; afterwards the background loop keeps the
+            # health flag current so requests skip the extra round trip.
+            # Both tasks are claimed before the first await, so concurrent
+            # first calls share one probe and one loop.
+            if self._health_task is None:
+                self._first_probe = asyncio.create_task(self._check_health())
+                self._health_task = asyncio.create_task(self._health_loop())
+            if not self._first_probe.done():
+                await asyncio.shield(self._first_probe)
+            elif not self._db_healthy:
+                raise ConnectionError("Database unavailable")
             return {
                 'workflow_id': workflow_id,
                 'status': 'running',
                 'user_id': user_id,
-                'execution_id': str(uuid4())
+                'execution_id': uuid4().hex
             }
         except Exception as e:
             logger.error(f"Workflow execution error: {str(e)}")
@@ -63,15 +125,21 @@ class WorkflowService:
     async def start_workflow(self, context: Any, prompt: str) -> str:
         """Start a new workflow.
 
+        Returns once the workflow_started event is stored; concurrent
+        starts share one batched write.
+
         Args:
             context: Workflow context
             prompt: Initial prompt
 
         Returns:
             Workflow ID
+
+        Raises:
+            Exception: If storing the event failed
         """
         workflow_id = str(uuid4())
-        await self.event_store.store_event(
+        stored = await self._event_queue.put(
             workflow_id=workflow_id,
             event_type="workflow_started",
             event_data={
@@ -79,22 +147,30 @@ class WorkflowService:
                 "context": context
             }
         )
+        await stored
         return workflow_id
 
     async def cancel_workflow(self, workflow_id: UUID) -> bool:
         """Cancel a workflow.
 
+        Returns once the workflow_cancelled event is stored; concurrent
+        cancellations share one batched write.
+
         Args:
             workflow_id: ID of workflow to cancel
 
         Returns:
-            True if workflow was cancelled
+            True once the cancellation is stored
+
+        Raises:
+            Exception: If storing the event failed
         """
-        await self.event_store.store_event(
+        stored = await self._event_queue.put(
             workflow_id=workflow_id,
             event_type="workflow_cancelled",
             event_data={}
         )
+        await stored
         return True
 
     async def list_workflows(self, tenant_id: str) -> List[Dict[str, Any]]:
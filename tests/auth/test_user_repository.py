@@ -1,39 +1,67 @@
 """Tests for user repository."""
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from datetime import datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
 from uuid import UUID, uuid4
 
 from src.auth.user_repository import UserRepository
-from src.database.connection import DatabaseConnection, get_connection
+
+class FakeDB:
+    """Minimal stand-in for DatabaseConnection.
+    
+    Only ``execute`` is used by the repository, so this avoids building a
+    spec'd MagicMock over the whole DatabaseConnection surface per test.
+    """
+    
+    def __init__(self):
+        self.execute = MagicMock(return_value=[])
 
 @pytest.fixture
 def mock_db():
     """Create mock database connection."""
-    return MagicMock(spec=DatabaseConnection)
+    return FakeDB()
 
 @pytest.fixture
 def user_repo(mock_db):
     """Create user repository with mock db."""
     return UserRepository(mock_db)
 
+_GET_BY_USERNAME_SQL = "SELECT * FROM users WHERE username = %s AND tenant_id = %s ALLOW FILTERING"
+_GET_BY_ID_SQL = "SELECT * FROM users WHERE id = %s"
+_DELETE_SQL = "DELETE FROM users WHERE id = %s"
+
+_EXISTS_SQL = "SELECT id FROM users WHERE id = %s"
+
+_UUIDS = tuple(uuid4() for _ in range(8))
+
+FROZEN_NOW = datetime(2024, 1, 1)
+SAMPLE_USER = MappingProxyType({
+    'id': _UUIDS[0],
+    'username': 'testuser',
+    'hashed_password': 'hashedpass123',
+    'email': 'test@example.com',
+    'tenant_id': 'tenant123',
+    'roles': ['user'],
+    'created_at': FROZEN_NOW,
+    'updated_at': FROZEN_NOW,
+    'failed_attempts': 0,
+    'locked_until': None
+})
+
 @pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze the repository clock at a fixed time."""
+    monkeypatch.setattr(
+        'src.auth.user_repository.datetime',
+        SimpleNamespace(utcnow=lambda: FROZEN_NOW)
+    )
+    return FROZEN_NOW
+
+@pytest.fixture(scope="session")
 def sample_user():
-    """Create sample user data."""
-    user_id = uuid4()
-    now = datetime.utcnow()
-    return {
-        'id': user_id,
-        'username': 'testuser',
-        'hashed_password': 'hashedpass123',
-        'email': 'test@example.com',
-        'tenant_id': 'tenant123',
-        'roles': ['user'],
-        'created_at': now,
-        'updated_at': now,
-        'failed_attempts': 0,
-        'locked_until': None
-    }
+    """Sample user data, shared read-only; use .copy() to modify."""
+    return SAMPLE_USER
 
 @pytest.mark.asyncio
 async def test_get_user_by_username_found(user_repo, mock_db, sample_user):
@@ -47,7 +75,7 @@ async def test_get_user_by_username_found(user_repo, mock_db, sample_user):
     
     assert result == sample_user
     mock_db.execute.assert_called_once_with(
-        "SELECT * FROM users WHERE username = %s AND tenant_id = %s ALLOW FILTERING",
+        _GET_BY_USERNAME_SQL,
         {'username': sample_user['username'], 'tenant_id': sample_user['tenant_id']}
     )
 
@@ -72,16 +100,13 @@ async def test_get_user_by_id_found(user_repo, mock_db, sample_user):
     result = await user_repo.get_user_by_id(sample_user['id'])
     
     assert result == sample_user
-    mock_db.execute.assert_called_once_with(
-        "SELECT * FROM users WHERE id = %s",
-        {'id': sample_user['id']}
-    )
+    mock_db.execute.assert_called_once_with(_GET_BY_ID_SQL, {'id': sample_user['id']})
 
 @pytest.mark.asyncio
 async def test_get_user_by_id_not_found(user_repo, mock_db):
     """Test getting user by ID when user does not exist."""
     mock_db.execute.return_value = []
-    user_id = uuid4()
+    user_id = _UUIDS[1]
     
     result = await user_repo.get_user_by_id(user_id)
     
@@ -89,7 +114,90 @@ async def test_get_user_by_id_not_found(user_repo, mock_db):
     mock_db.execute.assert_called_once()
 
 @pytest.mark.asyncio
-async def test_create_user(user_repo, mock_db):
+async def test_get_user_by_id_cached(user_repo, mock_db, sample_user):
+    """Test repeated lookups by ID are served from the cache."""
+    mock_db.execute.return_value = [sample_user]
+    
+    first = await user_repo.get_user_by_id(sample_user['id'])
+    second = await user_repo.get_user_by_id(sample_user['id'])
+    
+    assert first == second == sample_user
+    assert mock_db.execute.call_count == 1
+    
+    # Writes evict the cached user
+    await user_repo.delete_user(sample_user['id'])
+    await user_repo.get_user_by_id(sample_user['id'])
+    assert mock_db.execute.call_count == 3
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_returns_copies(user_repo, mock_db, sample_user):
+    """Test that mutating a returned user does not change the cached one."""
+    mock_db.execute.return_value = [dict(sample_user, roles=['user'])]
+    
+    first = await user_repo.get_user_by_id(sample_user['id'])
+    first['roles'].append('admin')
+    first['email'] = 'changed@example.com'
+    
+    assert await user_repo.get_user_by_id(sample_user['id']) == sample_user
+    assert mock_db.execute.call_count == 1
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_cache_expires(mock_db, sample_user):
+    """Test cached users are re-read after the TTL."""
+    user_repo = UserRepository(mock_db, cache_ttl=0)
+    mock_db.execute.return_value = [sample_user]
+    
+    await user_repo.get_user_by_id(sample_user['id'])
+    await user_repo.get_user_by_id(sample_user['id'])
+    
+    assert mock_db.execute.call_count == 2
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids(user_repo, mock_db, sample_user):
+    """Test batch lookup issues a single IN query."""
+    users = []
+    for user_id in _UUIDS[2:5]:
+        user = sample_user.copy()
+        user['id'] = user_id
+        users.append(user)
+    ids = [user['id'] for user in users]
+    mock_db.execute.return_value = list(reversed(users))
+    
+    result = await user_repo.get_users_by_ids(ids)
+    
+    assert result == users
+    mock_db.execute.assert_called_once_with(
+        "SELECT * FROM users WHERE id IN %s",
+        {'ids': tuple(ids)}
+    )
+    
+    # Users loaded in the batch are served from the cache afterwards
+    assert await user_repo.get_user_by_id(ids[0]) == users[0]
+    assert mock_db.execute.call_count == 1
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_string_ids(user_repo, mock_db, sample_user):
+    """Test that string IDs match UUID rows and share cache entries."""
+    users = []
+    for user_id in _UUIDS[2:4]:
+        user = sample_user.copy()
+        user['id'] = user_id
+        users.append(user)
+    mock_db.execute.return_value = users
+    
+    result = await user_repo.get_users_by_ids([str(user['id']) for user in users])
+    
+    assert result == users
+    mock_db.execute.assert_called_once_with(
+        "SELECT * FROM users WHERE id IN %s",
+        {'ids': tuple(_UUIDS[2:4])}
+    )
+    assert await user_repo.get_user_by_id(str(_UUIDS[2])) == users[0]
+    assert await user_repo.get_user_by_id(_UUIDS[3]) == users[1]
+    assert mock_db.execute.call_count == 1
+
+@pytest.mark.asyncio
+async def test_create_user(user_repo, mock_db, frozen_now, monkeypatch):
     """Test creating a new user."""
     username = 'newuser'
     hashed_password = 'hashedpass123'
@@ -97,73 +205,94 @@ async def test_create_user(user_repo, mock_db):
     tenant_id = 'tenant123'
     roles = ['user']
     
-    with patch('src.auth.user_repository.uuid4') as mock_uuid4, \
-         patch('src.auth.user_repository.datetime') as mock_datetime:
-        
-        user_id = uuid4()
-        mock_uuid4.return_value = user_id
-        now = datetime.utcnow()
-        mock_datetime.utcnow.return_value = now
-        
-        result = await user_repo.create_user(
-            username=username,
-            hashed_password=hashed_password,
-            email=email,
-            tenant_id=tenant_id,
-            roles=roles
-        )
-        
-        expected_user = {
-            'id': user_id,
-            'username': username,
-            'hashed_password': hashed_password,
-            'email': email,
-            'tenant_id': tenant_id,
-            'roles': roles,
-            'created_at': now,
-            'updated_at': now,
-            'failed_attempts': 0,
-            'locked_until': None
-        }
-        
-        assert result == expected_user
-        mock_db.execute.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_update_user(user_repo, mock_db, sample_user):
+    user_id = _UUIDS[5]
+    monkeypatch.setattr('src.auth.user_repository.uuid4', lambda: user_id)
+    
+    result = await user_repo.create_user(
+        username=username,
+        hashed_password=hashed_password,
+        email=email,
+        tenant_id=tenant_id,
+        roles=roles
+    )
+    
+    expected_user = {
+        'id': user_id,
+        'username': username,
+        'hashed_password': hashed_password,
+        'email': email,
+        'tenant_id': tenant_id,
+        'roles': roles,
+        'created_at': frozen_now,
+        'updated_at': frozen_now,
+        'failed_attempts': 0,
+        'locked_until': None
+    }
+    
+    assert result == expected_user
+    mock_db.execute.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_update_user(user_repo, mock_db, sample_user, frozen_now):
     """Test updating user data."""
     updates = {
         'email': 'updated@example.com',
         'roles': ['user', 'admin']
     }
     
-    with patch('src.auth.user_repository.datetime') as mock_datetime:
-        now = datetime.utcnow()
-        mock_datetime.utcnow.return_value = now
-        
-        # Mock get_user_by_id to return updated user
-        updated_user = sample_user.copy()
-        updated_user.update(updates)
-        updated_user['updated_at'] = now
-        mock_db.execute.side_effect = [None, [updated_user]]  # First None for UPDATE, then user for SELECT
-        
-        result = await user_repo.update_user(sample_user['id'], updates)
-        
-        assert result == updated_user
-        assert mock_db.execute.call_count == 2
+    updated_user = sample_user.copy()
+    updated_user.update(updates)
+    updated_user['updated_at'] = frozen_now
+    mock_db.execute.side_effect = [[{'id': sample_user['id']}], []]  # Existence check, then UPDATE
+    
+    result = await user_repo.update_user(sample_user['id'], updates, current=sample_user)
+    
+    assert result == updated_user
+    # Only the key is read back; the result is built from the known user
+    assert mock_db.execute.call_args_list[0].args == (_EXISTS_SQL, {'id': sample_user['id']})
+    assert mock_db.execute.call_count == 2
+
+@pytest.mark.asyncio
+async def test_update_user_missing_row(user_repo, mock_db, sample_user):
+    """Test that a missing user is reported without writing a partial row."""
+    mock_db.execute.return_value = []
+    
+    result = await user_repo.update_user(sample_user['id'], {'email': 'x@example.com'}, current=sample_user)
+    
+    assert result is None
+    mock_db.execute.assert_called_once_with(_EXISTS_SQL, {'id': sample_user['id']})
+
+@pytest.mark.asyncio
+async def test_update_user_query_error(user_repo, mock_db, sample_user):
+    """Test that a failing existence check skips the UPDATE."""
+    mock_db.execute.side_effect = RuntimeError("connection lost")
+    
+    with pytest.raises(RuntimeError):
+        await user_repo.update_user(sample_user['id'], {'email': 'x@example.com'})
+    mock_db.execute.assert_called_once_with(_GET_BY_ID_SQL, {'id': sample_user['id']})
+
+@pytest.mark.asyncio
+async def test_update_user_without_current(user_repo, mock_db, sample_user, frozen_now):
+    """Test updating user data reads the row first when no user is given."""
+    updated_user = sample_user.copy()
+    updated_user['email'] = 'updated@example.com'
+    updated_user['updated_at'] = frozen_now
+    mock_db.execute.side_effect = [[sample_user], []]  # First SELECT, then UPDATE
+    
+    result = await user_repo.update_user(sample_user['id'], {'email': 'updated@example.com'})
+    
+    assert result == updated_user
+    assert mock_db.execute.call_count == 2
 
 @pytest.mark.asyncio
 async def test_delete_user(user_repo, mock_db):
     """Test deleting a user."""
-    user_id = uuid4()
+    user_id = _UUIDS[6]
     
     result = await user_repo.delete_user(user_id)
     
     assert result is True
-    mock_db.execute.assert_called_once_with(
-        "DELETE FROM users WHERE id = %s",
-        {'id': user_id}
-    )
+    mock_db.execute.assert_called_once_with(_DELETE_SQL, {'id': user_id})
 
 @pytest.mark.asyncio
 async def test_increment_failed_attempts_user_not_found(user_repo, mock_db):
@@ -176,10 +305,13 @@ async def test_increment_failed_attempts_user_not_found(user_repo, mock_db):
     mock_db.execute.assert_called_once()
 
 @pytest.mark.asyncio
-async def test_increment_failed_attempts_below_limit(user_repo, mock_db, sample_user):
-    """Test incrementing failed attempts when below limit."""
+@pytest.mark.parametrize("attempts,expected_lock", [(2, False), (4, True)])
+async def test_increment_failed_attempts(
+    user_repo, mock_db, sample_user, frozen_now, attempts, expected_lock
+):
+    """Test incrementing failed attempts below and at the lockout limit."""
     user = sample_user.copy()
-    user['failed_attempts'] = 2
+    user['failed_attempts'] = attempts
     mock_db.execute.side_effect = [[user], None]  # First for get_user, second for update
     
     result = await user_repo.increment_failed_attempts(
@@ -187,30 +319,12 @@ async def test_increment_failed_attempts_below_limit(user_repo, mock_db, sample_
         user['tenant_id']
     )
     
-    assert result == 3
+    assert result == attempts + 1
     assert mock_db.execute.call_count == 2
-
-@pytest.mark.asyncio
-async def test_increment_failed_attempts_reaches_limit(user_repo, mock_db, sample_user):
-    """Test incrementing failed attempts when reaching limit."""
-    user = sample_user.copy()
-    user['failed_attempts'] = 4
-    mock_db.execute.side_effect = [[user], None]  # First for get_user, second for update
-    
-    with patch('src.auth.user_repository.datetime') as mock_datetime:
-        now = datetime.utcnow()
-        mock_datetime.utcnow.return_value = now
-        
-        result = await user_repo.increment_failed_attempts(
-            user['username'],
-            user['tenant_id']
-        )
-        
-        assert result == 5
-        assert mock_db.execute.call_count == 2
-        # Verify locked_until was set in the update query
-        update_call = mock_db.execute.call_args_list[1]
-        assert update_call[0][1]['locked_until'] == now + timedelta(minutes=30)
+    # Verify locked_until in the update query
+    update_call = mock_db.execute.call_args_list[1]
+    expected_locked_until = frozen_now + timedelta(minutes=30) if expected_lock else None
+    assert update_call[0][1]['locked_until'] == expected_locked_until
 
 @pytest.mark.asyncio
 async def test_reset_failed_attempts_user_not_found(user_repo, mock_db):
@@ -223,25 +337,21 @@ async def test_reset_failed_attempts_user_not_found(user_repo, mock_db):
     mock_db.execute.assert_called_once()
 
 @pytest.mark.asyncio
-async def test_reset_failed_attempts_success(user_repo, mock_db, sample_user):
+async def test_reset_failed_attempts_success(user_repo, mock_db, sample_user, frozen_now):
     """Test resetting failed attempts successfully."""
     user = sample_user.copy()
     user['failed_attempts'] = 3
-    user['locked_until'] = datetime.utcnow()
+    user['locked_until'] = frozen_now
     mock_db.execute.side_effect = [[user], None]  # First for get_user, second for update
     
-    with patch('src.auth.user_repository.datetime') as mock_datetime:
-        now = datetime.utcnow()
-        mock_datetime.utcnow.return_value = now
-        
-        result = await user_repo.reset_failed_attempts(
-            user['username'],
-            user['tenant_id']
-        )
-        
-        assert result is True
-        assert mock_db.execute.call_count == 2
-        # Verify failed_attempts and locked_until were reset in update query
-        update_call = mock_db.execute.call_args_list[1]
-        assert 'failed_attempts = 0' in update_call[0][0]
-        assert 'locked_until = null' in update_call[0][0]
+    result = await user_repo.reset_failed_attempts(
+        user['username'],
+        user['tenant_id']
+    )
+    
+    assert result is True
+    assert mock_db.execute.call_count == 2
+    # Verify failed_attempts and locked_until were reset in update query
+    update_call = mock_db.execute.call_args_list[1]
+    assert 'failed_attempts = 0' in update_call[0][0]
+    assert 'locked_until = null' in update_call[0][0]
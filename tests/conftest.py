@@ -2,31 +2,11 @@
 Test configuration and shared fixtures for Agent360 tests.
 """
 import pytest
+import pytest_asyncio
 import asyncio
 import os
-from typing import Generator, Any, AsyncGenerator
+from typing import Generator, Any, AsyncGenerator, TYPE_CHECKING
 from datetime import datetime
-from fastapi.testclient import TestClient
-
-from src.api.main import app
-from src.auth.authentication_service import AuthenticationService
-from src.workflows.workflow_service import WorkflowService
-from tests.fixtures.mock_services import (
-    mock_db,
-    mock_redis_service,
-    mock_event_store,
-    mock_model_client,
-    mock_settings,
-)
-
-# Re-export fixtures
-__all__ = [
-    'mock_db',
-    'mock_redis_service',
-    'mock_event_store',
-    'mock_model_client',
-    'mock_settings',
-]
 
 # Performance test configurations
 PERF_TEST_DURATION = int(os.getenv('PERF_TEST_DURATION', '60'))  # seconds
@@ -34,23 +14,76 @@ PERF_TEST_USERS = int(os.getenv('PERF_TEST_USERS', '10'))  # concurrent users
 PERF_TEST_RAMPUP = int(os.getenv('PERF_TEST_RAMPUP', '30'))  # seconds
 PERF_TEST_REQUESTS = int(os.getenv('PERF_TEST_REQUESTS', '1000'))  # total requests
 
-# Use pytest-asyncio's event loop
-pytest_plugins = ['pytest_asyncio']
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+# Use pytest-asyncio's event loop; shared mock fixtures are registered
+# once here as a plugin rather than imported into individual modules
+pytest_plugins = ['pytest_asyncio', 'tests.fixtures.mock_services']
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
+# Python 3.12+; lets mock-backed coroutines finish without a loop hop
+eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+
+def _with_eager_tasks(
+    policy: asyncio.AbstractEventLoopPolicy
+) -> asyncio.AbstractEventLoopPolicy:
+    """Install the eager task factory on every loop the policy creates."""
+    if eager_task_factory is None:
+        return policy
+    
+    new_event_loop = policy.new_event_loop
+    
+    def new_eager_event_loop() -> asyncio.AbstractEventLoop:
+        loop = new_event_loop()
+        loop.set_task_factory(eager_task_factory)
+        return loop
+    
+    policy.new_event_loop = new_eager_event_loop
+    return policy
 
 @pytest.fixture(scope='session')
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when installed, with eager tasks where supported."""
+    if uvloop is not None:
+        return _with_eager_tasks(uvloop.EventLoopPolicy())
+    return _with_eager_tasks(asyncio.DefaultEventLoopPolicy())
+
+# Session-scoped async fixtures opt in to the session loop; everything
+# else gets a fresh loop per test
+@pytest_asyncio.fixture(scope='session', loop_scope='session')
 async def async_session():
     """Create an async session for managing async resources."""
     # Setup
     yield
     # Cleanup
 
+@pytest.fixture(scope='session')
+def _client() -> Generator['TestClient', None, None]:
+    """Run app startup/shutdown once and share the client across tests."""
+    # Imported lazily so tests that never use the API skip loading the app
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+    
+    with TestClient(app) as client:
+        yield client
+
 @pytest.fixture
 async def test_client(
+    _client,
     mock_db,
     mock_event_store,
     mock_settings
-) -> AsyncGenerator[TestClient, None]:
+) -> AsyncGenerator['TestClient', None]:
     """Create test client with mocked services."""
+    from src.api.main import app
+    from src.auth.authentication_service import AuthenticationService
+    from src.workflows.workflow_service import WorkflowService
+    
     # Setup authentication service
     auth_service = AuthenticationService(mock_db)
     app.dependency_overrides[AuthenticationService] = lambda: auth_service
@@ -59,9 +92,7 @@ async def test_client(
     workflow_service = WorkflowService(mock_event_store)
     app.dependency_overrides[WorkflowService] = lambda: workflow_service
     
-    # Setup test client
-    async with TestClient(app) as client:
-        yield client
+    yield _client
         
     # Cleanup
     app.dependency_overrides.clear()
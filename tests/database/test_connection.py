@@ -1,15 +1,16 @@
 """Tests for database connection management."""
+import asyncio
+import time
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from cassandra.cluster import Cluster, Session
 from cassandra.auth import PlainTextAuthProvider
 
 from src.database.connection import DatabaseConnection, get_connection, MockSession, MockCluster
 from src.config import Settings
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_settings():
-    """Create mock settings."""
+    """Create mock settings once per session."""
     return Settings(
         cassandra_hosts=["localhost"],
         cassandra_port=9042,
@@ -18,13 +19,33 @@ def mock_settings():
         cassandra_password="test_pass"
     )
 
+@pytest.fixture(autouse=True)
+def _reset_connection(monkeypatch):
+    """Give each test a fresh DatabaseConnection singleton."""
+    monkeypatch.setattr(DatabaseConnection, "_instance", None, raising=False)
+    monkeypatch.setattr("src.database.connection._connection", None)
+    yield
+
+class _StubSession:
+    """Stand-in for cassandra Session exposing only what the tests use."""
+    
+    def __init__(self):
+        self.execute = MagicMock(return_value=[])
+        self.set_keyspace = MagicMock()
+        self.execute_async = MagicMock()
+        self.shutdown = MagicMock()
+
+class _StubCluster:
+    """Stand-in for cassandra Cluster exposing only what the tests use."""
+    
+    def __init__(self):
+        self.connect = MagicMock(return_value=_StubSession())
+        self.shutdown = MagicMock()
+
 @pytest.fixture
 def mock_cluster():
     """Create mock Cassandra cluster."""
-    cluster = MagicMock(spec=Cluster)
-    session = MagicMock(spec=Session)
-    cluster.connect.return_value = session
-    return cluster
+    return _StubCluster()
 
 @pytest.fixture
 def mock_session(mock_cluster):
@@ -35,13 +56,7 @@ def mock_session(mock_cluster):
 def db_connection(mock_settings):
     """Create database connection with mock settings."""
     with patch("src.database.connection.get_settings", return_value=mock_settings):
-        conn = DatabaseConnection()
-        yield conn
-        # Clean up
-        if conn._session:
-            conn._session.shutdown()
-        if conn._cluster:
-            conn._cluster.shutdown()
+        yield DatabaseConnection()
 
 @pytest.mark.asyncio
 async def test_singleton_pattern():
@@ -104,6 +119,51 @@ async def test_execute_query_offline(db_connection):
     result = db_connection.execute("SELECT * FROM test")
     assert result == []
 
+@pytest.mark.asyncio
+async def test_execute_in_executor_does_not_block_loop(db_connection):
+    """Test concurrent queries overlap instead of blocking the loop."""
+    def slow_execute(query, params=None):
+        time.sleep(0.1)
+        return [{"id": 1}]
+    
+    db_connection.offline_mode = False
+    db_connection._session = Mock()
+    db_connection._session.execute.side_effect = slow_execute
+    
+    start = time.monotonic()
+    results = await asyncio.gather(*[
+        db_connection.execute_in_executor("SELECT * FROM test")
+        for _ in range(10)
+    ])
+    elapsed = time.monotonic() - start
+    
+    assert results == [[{"id": 1}]] * 10
+    # Serial execution on the loop would take ~1s
+    assert elapsed < 0.5
+
+@pytest.mark.asyncio
+async def test_execute_in_executor_raises_query_errors(db_connection):
+    """Test that async query errors reach the caller instead of an empty result."""
+    db_connection.offline_mode = False
+    db_connection._session = Mock()
+    db_connection._session.execute.side_effect = RuntimeError("write timeout")
+    
+    with pytest.raises(RuntimeError, match="write timeout"):
+        await db_connection.execute_in_executor("SELECT * FROM test")
+
+@pytest.mark.asyncio
+async def test_execute_many_raises_batch_errors(db_connection):
+    """Test that a failed batch write is reported to the caller."""
+    db_connection.offline_mode = False
+    db_connection._session = Mock()
+    db_connection._session.prepare.side_effect = lambda query: query
+    db_connection._session.execute.side_effect = RuntimeError("batch too large")
+    
+    with pytest.raises(RuntimeError, match="batch too large"):
+        await db_connection.execute_many(
+            "INSERT INTO test (id) VALUES (%s)", [(1,), (2,)]
+        )
+
 @pytest.mark.asyncio
 async def test_execute_async_query_online(db_connection, mock_cluster, mock_session):
     """Test async query execution in online mode."""
@@ -2,18 +2,40 @@
 Mock services for testing external dependencies.
 """
 import pytest
-from typing import Dict, Any
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 from unittest.mock import AsyncMock, MagicMock
 import asyncio
 
+from src.agent_runtime.context_mock import AgentContext, AgentState
+
 class MockDatabaseConnection:
     """Mock database connection for testing."""
-    def __init__(self):
+    def __init__(self, record_calls: bool = False):
         self.connected = False
-        self.execute = AsyncMock()
-        self.fetch_one = AsyncMock()
-        self.fetch_all = AsyncMock()
-        self.transaction = AsyncMock()
+        if record_calls:
+            # Shadow the no-op methods for tests that assert on calls
+            self.execute = AsyncMock()
+            self.fetch_one = AsyncMock()
+            self.fetch_all = AsyncMock()
+            self.transaction = AsyncMock()
+            
+    async def execute(self, *args, **kwargs):
+        """Execute a query."""
+        return None
+        
+    async def fetch_one(self, *args, **kwargs):
+        """Fetch a single row."""
+        return None
+        
+    async def fetch_all(self, *args, **kwargs):
+        """Fetch all rows."""
+        return None
+        
+    async def transaction(self, *args, **kwargs):
+        """Start a transaction."""
+        return None
         
     async def connect(self):
         """Connect to database."""
@@ -39,8 +61,7 @@ class MockRedisService:
         self.data[key] = value
         
     async def delete(self, key: str) -> None:
-        if key in self.data:
-            del self.data[key]
+        self.data.pop(key, None)
             
     async def exists(self, key: str) -> bool:
         return key in self.data
@@ -48,11 +69,9 @@ class MockRedisService:
 class MockEventStore:
     """Mock event store for testing."""
     def __init__(self):
-        self.events: Dict[str, list] = {}
+        self.events: Dict[str, list] = defaultdict(list)
         
     async def append_event(self, stream_id: str, event_type: str, event_data: Dict[str, Any]) -> None:
-        if stream_id not in self.events:
-            self.events[stream_id] = []
         self.events[stream_id].append({
             "type": event_type,
             "data": event_data
@@ -99,21 +118,44 @@ class MockModelClient:
         
     async def setup_responses(self, responses: Dict[str, Any]) -> None:
         """Setup mock responses for different prompts."""
-        self.generate.side_effect = lambda prompt, **kwargs: responses.get(prompt, self.default_responses["chain_of_thought"])
+        lookup = responses.get
+        default = self.default_responses["chain_of_thought"]
+        
+        def respond(prompt, **kwargs):
+            return lookup(prompt, default)
+            
+        self.generate.side_effect = respond
         
     async def setup_stream_responses(self, responses: Dict[str, Any]) -> None:
         """Setup mock streaming responses."""
-        self.stream.side_effect = lambda prompt, **kwargs: iter(responses.get(prompt, []))
+        lookup = responses.get
+        
+        def respond(prompt, **kwargs):
+            return iter(lookup(prompt, ()))
+            
+        self.stream.side_effect = respond
         
     def set_workflow_type(self, workflow_type: str) -> None:
         """Set the type of workflow responses."""
         if workflow_type in self.default_responses:
             self.generate.return_value = self.default_responses[workflow_type]
 
+# Workflow status codes stored in MockTemporalService._status
+RUNNING, SUCCESS, ERROR, CANCELLED = range(4)
+_NOT_FOUND_STATE = MappingProxyType({"status": "not_found"})
+
 class MockTemporalService:
-    """Mock Temporal service for testing."""
+    """Mock Temporal service for testing.
+    
+    Workflow status codes and results are kept as parallel arrays
+    addressed through one id-to-slot index, so the cancellation check
+    is a dict hit plus a byte read.
+    """
     def __init__(self):
-        self.workflows: Dict[str, Dict[str, Any]] = {}
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._status = bytearray()
+        self._results: List[Dict[str, Any]] = []
         self.connect = AsyncMock()
         self.start_worker = AsyncMock()
         self.close = AsyncMock()
@@ -126,7 +168,8 @@ class MockTemporalService:
     ) -> Dict[str, Any]:
         """Execute a workflow."""
         # Check if workflow is cancelled
-        if workflow_id in self.workflows and self.workflows[workflow_id]["status"] == "cancelled":
+        slot = self._index.get(workflow_id)
+        if slot is not None and self._status[slot] == CANCELLED:
             raise asyncio.CancelledError()
             
         # Simulate workflow execution
@@ -160,19 +203,30 @@ class MockTemporalService:
                 }
             ]
         
-        self.workflows[workflow_id] = workflow_result
+        status = ERROR if workflow_result["status"] == "error" else SUCCESS
+        if slot is None:
+            self._index[workflow_id] = len(self._ids)
+            self._ids.append(workflow_id)
+            self._status.append(status)
+            self._results.append(workflow_result)
+        else:
+            self._status[slot] = status
+            self._results[slot] = workflow_result
         return workflow_result
     
-    async def get_workflow_state(self, workflow_id: str) -> Dict[str, Any]:
+    async def get_workflow_state(self, workflow_id: str) -> Mapping[str, Any]:
         """Get workflow state."""
-        return self.workflows.get(workflow_id, {
-            "status": "not_found"
-        })
+        slot = self._index.get(workflow_id)
+        if slot is None:
+            return _NOT_FOUND_STATE
+        return self._results[slot]
         
     async def cancel_workflow(self, workflow_id: str) -> None:
         """Cancel a workflow."""
-        if workflow_id in self.workflows:
-            self.workflows[workflow_id]["status"] = "cancelled"
+        slot = self._index.get(workflow_id)
+        if slot is not None:
+            self._status[slot] = CANCELLED
+            self._results[slot]["status"] = "cancelled"
 
 @pytest.fixture
 def mock_db() -> MockDatabaseConnection:
@@ -194,6 +248,15 @@ def mock_model_client() -> MockModelClient:
     """Mock model client fixture."""
     return MockModelClient()
 
+@pytest.fixture
+def base_context() -> AgentContext:
+    """Mock agent context; derive variants with dataclasses.replace."""
+    return AgentContext(
+        state=AgentState(tenant_id="test"),
+        model_config={"model": "gpt-4"},
+        tool_config={}
+    )
+
 @pytest.fixture
 async def mock_temporal_service() -> MockTemporalService:
     """Fixture for mock temporal service."""
@@ -1,18 +1,75 @@
+from functools import lru_cache
+
 import pytest
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
+@lru_cache(maxsize=None)
+def _get_apis():
+    """Load Kubernetes configuration once and build the API clients."""
+    try:
+        config.load_kube_config()
+    except Exception:
+        config.load_incluster_config()
+    # One ApiClient so all API groups share a connection pool
+    api_client = client.ApiClient()
+    return (
+        client.CoreV1Api(api_client),
+        client.AppsV1Api(api_client),
+        client.NetworkingV1Api(api_client),
+    )
+
+@pytest.mark.no_parallel
 class TestKubernetesResources:
     @classmethod
     def setup_class(cls):
         """Set up Kubernetes client configuration."""
-        try:
-            config.load_kube_config()
-        except Exception:
-            config.load_incluster_config()
-        cls.v1 = client.CoreV1Api()
-        cls.apps_v1 = client.AppsV1Api()
+        cls.v1, cls.apps_v1, cls.networking_v1 = _get_apis()
         cls.namespace = "agent360"
+        cls._snapshot = None
+
+    @classmethod
+    def _list_all(cls, list_fn, limit=500):
+        """Yield every item of a namespaced list call, page by page.
+        
+        Args:
+            list_fn: A list_namespaced_* API method
+            limit: Maximum items per page
+        """
+        token = None
+        while True:
+            kwargs = {"limit": limit}
+            if token:
+                kwargs["_continue"] = token
+            page = list_fn(cls.namespace, **kwargs)
+            yield from page.items
+            token = page.metadata._continue
+            if not token:
+                break
+
+    @classmethod
+    def cluster_snapshot(cls):
+        """Fetch namespace resources once and share them across tests.
+        
+        Listed deployments already carry their status, so no per-deployment
+        reads are needed.
+        """
+        if cls._snapshot is None:
+            cls._snapshot = {
+                "deployments": {
+                    dep.metadata.name: dep
+                    for dep in cls._list_all(cls.apps_v1.list_namespaced_deployment)
+                },
+                "services": {
+                    svc.metadata.name: svc
+                    for svc in cls._list_all(cls.v1.list_namespaced_service)
+                },
+                "pods": list(cls._list_all(cls.v1.list_namespaced_pod)),
+                "ingresses": list(
+                    cls._list_all(cls.networking_v1.list_namespaced_ingress)
+                ),
+            }
+        return cls._snapshot
 
     def test_namespace_exists(self):
         """Test if the agent360 namespace exists."""
@@ -25,16 +82,17 @@ class TestKubernetesResources:
         required_deployments = ["agent360-api", "redis", "cassandra", "temporal"]
         
         try:
-            deployments = self.apps_v1.list_namespaced_deployment(self.namespace)
-            deployment_names = [dep.metadata.name for dep in deployments.items]
+            deployments = self.cluster_snapshot()["deployments"]
             
-            for dep in required_deployments:
-                assert dep in deployment_names, f"Deployment {dep} not found"
-                
-                # Check deployment status
-                deployment = self.apps_v1.read_namespaced_deployment(dep, self.namespace)
-                assert deployment.status.ready_replicas == deployment.status.replicas, \
-                    f"Deployment {dep} not fully ready"
+            missing = [dep for dep in required_deployments if dep not in deployments]
+            assert not missing, f"Deployments not found: {missing}"
+            
+            # Check deployment status from the listed objects
+            not_ready = [
+                dep for dep in required_deployments
+                if deployments[dep].status.ready_replicas != deployments[dep].status.replicas
+            ]
+            assert not not_ready, f"Deployments not fully ready: {not_ready}"
         except ApiException as e:
             pytest.fail(f"Failed to check deployments: {e}")
 
@@ -43,19 +101,17 @@ class TestKubernetesResources:
         required_services = ["agent360-api", "redis", "cassandra", "temporal"]
         
         try:
-            services = self.v1.list_namespaced_service(self.namespace)
-            service_names = [svc.metadata.name for svc in services.items]
+            services = self.cluster_snapshot()["services"]
             
             for svc in required_services:
-                assert svc in service_names, f"Service {svc} not found"
+                assert svc in services, f"Service {svc} not found"
         except ApiException as e:
             pytest.fail(f"Failed to check services: {e}")
 
     def test_pods_healthy(self):
         """Test if all pods are in Running state."""
         try:
-            pods = self.v1.list_namespaced_pod(self.namespace)
-            for pod in pods.items:
+            for pod in self.cluster_snapshot()["pods"]:
                 assert pod.status.phase == "Running", \
                     f"Pod {pod.metadata.name} not running. Status: {pod.status.phase}"
                 
@@ -69,8 +125,7 @@ class TestKubernetesResources:
     def test_resource_limits(self):
         """Test if resource limits are properly set."""
         try:
-            pods = self.v1.list_namespaced_pod(self.namespace)
-            for pod in pods.items:
+            for pod in self.cluster_snapshot()["pods"]:
                 for container in pod.spec.containers:
                     assert container.resources.limits, \
                         f"Container {container.name} in pod {pod.metadata.name} has no resource limits"
@@ -81,13 +136,11 @@ class TestKubernetesResources:
 
     def test_ingress_configuration(self):
         """Test if ingress is properly configured."""
-        networking_v1 = client.NetworkingV1Api()
-        
         try:
-            ingresses = networking_v1.list_namespaced_ingress(self.namespace)
-            assert len(ingresses.items) > 0, "No ingress found"
+            ingresses = self.cluster_snapshot()["ingresses"]
+            assert len(ingresses) > 0, "No ingress found"
             
-            ingress = ingresses.items[0]
+            ingress = ingresses[0]
             assert ingress.spec.rules, "No ingress rules configured"
             assert ingress.spec.tls, "TLS not configured for ingress"
         except ApiException as e:
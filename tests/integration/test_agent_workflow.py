@@ -3,16 +3,24 @@ Integration tests for Agent360 workflow.
 """
 import pytest
 import asyncio
-import uuid
+import itertools
+import os
 from typing import Dict, Any, AsyncGenerator
 from src.monitoring.metrics import metrics
-from tests.fixtures.mock_services import mock_temporal_service
 
 pytestmark = pytest.mark.asyncio
 
+# Workflow IDs only need to be unique within a run; the PID keeps them
+# distinct across xdist workers
+_counter = itertools.count()
+
+def _next_workflow_id() -> str:
+    """Return a run-unique workflow ID."""
+    return f"test-wf-{os.getpid()}-{next(_counter)}"
+
 async def test_basic_workflow(mock_temporal_service):
     """Test basic agent workflow execution."""
-    workflow_id = str(uuid.uuid4())
+    workflow_id = _next_workflow_id()
     input_data = {
         "query": "What is the weather in London?",
         "tools": ["rest_tool"]
@@ -38,7 +46,7 @@ async def test_basic_workflow(mock_temporal_service):
 
 async def test_tool_execution(mock_temporal_service):
     """Test tool execution within workflow."""
-    workflow_id = str(uuid.uuid4())
+    workflow_id = _next_workflow_id()
     input_data = {
         "query": "Execute test tool",
         "tools": ["test_tool"]
@@ -64,7 +72,7 @@ async def test_tool_execution(mock_temporal_service):
 
 async def test_error_recovery(mock_temporal_service):
     """Test error recovery mechanisms."""
-    workflow_id = str(uuid.uuid4())
+    workflow_id = _next_workflow_id()
     input_data = {
         "query": "Trigger error",
         "tools": ["error_tool"]
@@ -2,13 +2,11 @@
 Integration tests for Agent360 API.
 """
 import pytest
-from fastapi.testclient import TestClient
-from src.api.main import app
 
 @pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+def client(_client):
+    """Test client shared across the session (see conftest)."""
+    return _client
 
 def test_health_check(client):
     """Test health check endpoint."""
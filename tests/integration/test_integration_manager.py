@@ -1,59 +1,188 @@
 """Tests for integration manager."""
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
+from collections import Counter
 from datetime import datetime
+from fnmatch import fnmatchcase
+from types import MappingProxyType
 import asyncio
-from typing import Dict, Any
-import json
+from typing import Dict, Any, List, Optional
 
-from src.integrations.integration_manager import IntegrationManager, IntegrationConfig
+import orjson
+
+from src.integrations.integration_manager import IntegrationManager, IntegrationConfig, make_cache_key
 from src.database.connection import DatabaseConnection
 from src.infrastructure.redis_client import RedisClient
 
+def future_mock(result: Any = None) -> Mock:
+    """Create a cheap awaitable mock that returns an already-resolved future.
+    
+    Unlike AsyncMock, no coroutine is built per call. The future resolves
+    to the mock's return_value, so tests can keep setting return_value
+    and using the usual assert_called_* helpers.
+    
+    Args:
+        result: Initial value the returned futures resolve to
+        
+    Returns:
+        Mock whose calls return completed futures
+    """
+    mock = Mock(return_value=result)
+    
+    def resolve(*args, **kwargs):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(mock.return_value)
+        return future
+    
+    mock.side_effect = resolve
+    return mock
+
+class FakeDB:
+    """Plain database fake for hot-path tests that don't inspect calls.
+    
+    Calls cost one method dispatch instead of AsyncMock's bookkeeping;
+    ``calls`` keeps a per-method count for the odd assertion.
+    """
+    def __init__(self, result: Any = None):
+        self.result = result
+        self.calls: Counter = Counter()
+        
+    async def prepare(self, query: str) -> str:
+        self.calls["prepare"] += 1
+        return query
+        
+    async def execute_in_executor(self, *args) -> Any:
+        self.calls["execute_in_executor"] += 1
+        return self.result
+        
+    async def execute_many(self, *args) -> None:
+        self.calls["execute_many"] += 1
+
+class FakeRedis:
+    """Dict-backed Redis fake mirroring the RedisClient calls used by integrations.
+    
+    Values are stored encoded and decoded on read the way RedisClient
+    does, so ``data`` holds what Redis itself would.
+    """
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+        self.ttls: Dict[str, Optional[int]] = {}
+        self.calls: Counter = Counter()
+        
+    async def mget(self, keys: List[str], default: Any = None) -> List[Any]:
+        self.calls["mget"] += 1
+        values = []
+        for key in keys:
+            value = self.data.get(key)
+            if value is None:
+                values.append(default)
+                continue
+            try:
+                values.append(orjson.loads(value))
+            except orjson.JSONDecodeError:
+                values.append(value)
+        return values
+        
+    async def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        self.calls["set_many"] += 1
+        self.data.update(
+            (key, value if isinstance(value, (str, bytes)) else orjson.dumps(value))
+            for key, value in mapping.items()
+        )
+        self.ttls.update(dict.fromkeys(mapping, ttl))
+        return True
+        
+    async def delete(self, key: str) -> bool:
+        self.calls["delete"] += 1
+        self.ttls.pop(key, None)
+        return self.data.pop(key, None) is not None
+        
+    async def keys(self, pattern: str) -> List[str]:
+        self.calls["keys"] += 1
+        return [key for key in self.data if fnmatchcase(key, pattern)]
+
+_real_sleep = asyncio.sleep
+
+async def _yield_sleep(delay, result=None):
+    """Stand-in for asyncio.sleep that yields to the loop once without waiting."""
+    await _real_sleep(0)
+    return result
+
+@pytest.fixture(autouse=True)
+def fast_sleep(request, monkeypatch):
+    """Skip simulated latency and retry backoff unless a test opts out with real_sleep."""
+    if request.node.get_closest_marker("real_sleep") is None:
+        monkeypatch.setattr(asyncio, "sleep", _yield_sleep)
+
+def _all_misses(keys):
+    """Redis MGET result for a cold cache."""
+    return [None] * len(keys)
+
 @pytest.fixture
 def mock_db():
-    """Create mock database connection."""
-    mock = AsyncMock(spec=DatabaseConnection)
-    mock.execute = AsyncMock()
+    """Spec'd database mock."""
+    mock = Mock(spec=DatabaseConnection)
+    mock.execute_in_executor = future_mock()
+    mock.execute_many = future_mock()
+    # Prepared statements stand in as their query text
+    mock.prepare = AsyncMock(side_effect=lambda query: query)
     return mock
 
 @pytest.fixture
 def mock_redis():
-    """Mock Redis client."""
+    """Spec'd Redis mock with a cold cache."""
     mock = AsyncMock(spec=RedisClient)
-    mock.get = AsyncMock(return_value=None)  # Default to cache miss
-    mock.set = AsyncMock()
+    mock.mget = AsyncMock(side_effect=_all_misses)  # Default to cache miss
+    mock.set_many = AsyncMock(return_value=True)
     mock.delete = AsyncMock()
     mock.keys = AsyncMock(return_value=["key1", "key2"])  # Return some keys
     return mock
 
 @pytest.fixture
 def integration_manager(mock_db, mock_redis):
-    """Create integration manager with mocks."""
+    """Integration manager with its own registry, statement cache and L1 cache."""
     return IntegrationManager(mock_db, mock_redis)
 
 @pytest.fixture
+def fake_db():
+    """Plain database fake for tests that don't assert on DB calls."""
+    return FakeDB()
+
+@pytest.fixture
+def fake_redis():
+    """Dict-backed Redis fake for tests that only check cache contents."""
+    return FakeRedis()
+
+@pytest.fixture
+def fake_manager(fake_db, fake_redis):
+    """Integration manager wired to the plain fakes."""
+    return IntegrationManager(fake_db, fake_redis)
+
+# Built once; the manager only reads these values
+SAMPLE_INTEGRATION_CONFIG = MappingProxyType({
+    'integration_type': 'test_integration',
+    'config': {'api_key': 'test_key', 'endpoint': 'https://test.com'},
+    'enabled': True,
+    'retry_policy': {'max_retries': 3, 'delay_seconds': 1},
+    'timeout_seconds': 30,
+    'cache_ttl_seconds': 3600
+})
+
+@pytest.fixture(scope="session")
 def sample_integration_config():
-    """Create sample integration config."""
-    return {
-        'integration_type': 'test_integration',
-        'config': {'api_key': 'test_key', 'endpoint': 'https://test.com'},
-        'enabled': True,
-        'retry_policy': {'max_retries': 3, 'delay_seconds': 1},
-        'timeout_seconds': 30,
-        'cache_ttl_seconds': 3600
-    }
+    """Sample integration config shared across tests."""
+    return SAMPLE_INTEGRATION_CONFIG
 
 @pytest.mark.asyncio
 async def test_initialize(integration_manager, mock_db, sample_integration_config):
     """Test initialization of integration manager."""
     # Mock database response
-    mock_db.execute.return_value = [sample_integration_config]
+    mock_db.execute_in_executor.return_value = [sample_integration_config]
     
     await integration_manager.initialize()
     
     # Verify database was queried
-    mock_db.execute.assert_called_once_with("SELECT * FROM integrations")
+    mock_db.execute_in_executor.assert_called_once_with("SELECT * FROM integrations")
     
     # Verify integration was loaded
     integration = await integration_manager.get_integration(sample_integration_config['integration_type'])
@@ -78,8 +207,8 @@ async def test_register_integration(integration_manager, mock_db, sample_integra
         )
         
         # Verify database insert
-        mock_db.execute.assert_called_once()
-        call_args = mock_db.execute.call_args[0]
+        mock_db.execute_in_executor.assert_called_once()
+        call_args = mock_db.execute_in_executor.call_args[0]
         assert "INSERT INTO integrations" in call_args[0]
         assert call_args[1][0] == sample_integration_config['integration_type']
         
@@ -89,6 +218,69 @@ async def test_register_integration(integration_manager, mock_db, sample_integra
         assert integration.integration_type == sample_integration_config['integration_type']
         assert integration.config == sample_integration_config['config']
 
+@pytest.mark.asyncio
+async def test_statements_are_prepared_once(integration_manager, mock_db):
+    """Test that repeated writes reuse one prepared statement."""
+    for i in range(3):
+        await integration_manager.register_integration(
+            integration_type=f"prepared_{i}",
+            config={"key": "value"}
+        )
+    
+    mock_db.prepare.assert_called_once()
+    assert mock_db.execute_in_executor.call_count == 3
+
+@pytest.mark.asyncio
+async def test_register_integrations_batches_inserts(integration_manager, mock_db):
+    """Test that bulk registration writes every row in one call."""
+    configs = [
+        IntegrationConfig(integration_type=f"bulk_{i}", config={"index": i})
+        for i in range(3)
+    ]
+    
+    await integration_manager.register_integrations(configs)
+    
+    mock_db.execute_in_executor.assert_not_called()
+    mock_db.execute_many.assert_called_once()
+    query, rows = mock_db.execute_many.call_args[0]
+    assert "INSERT INTO integrations" in query
+    assert [row[0] for row in rows] == ["bulk_0", "bulk_1", "bulk_2"]
+    for config in configs:
+        assert await integration_manager.get_integration(config.integration_type) is config
+    
+    # Later batches reuse the cached prepared statement
+    await integration_manager.register_integrations(configs)
+    mock_db.prepare.assert_called_once_with(query)
+
+@pytest.mark.asyncio
+async def test_register_integrations_validates_before_writing(integration_manager, mock_db):
+    """Test that one invalid config aborts the whole batch."""
+    configs = [
+        IntegrationConfig(integration_type="good", config={}),
+        IntegrationConfig(integration_type="bad", config={}, timeout_seconds=-1)
+    ]
+    
+    with pytest.raises(ValueError, match="Timeout must be positive"):
+        await integration_manager.register_integrations(configs)
+    
+    mock_db.execute_many.assert_not_called()
+    assert await integration_manager.get_integration("good") is None
+
+@pytest.mark.asyncio
+async def test_register_integrations_write_failure_leaves_registry(integration_manager, mock_db):
+    """Test that a failed batch write does not register anything locally."""
+    configs = [
+        IntegrationConfig(integration_type=f"bulk_{i}", config={})
+        for i in range(2)
+    ]
+    mock_db.execute_many = AsyncMock(side_effect=RuntimeError("batch rejected"))
+    
+    with pytest.raises(RuntimeError, match="batch rejected"):
+        await integration_manager.register_integrations(configs)
+    
+    for config in configs:
+        assert await integration_manager.get_integration(config.integration_type) is None
+
 @pytest.mark.asyncio
 async def test_update_integration(integration_manager, mock_db, sample_integration_config):
     """Test updating an existing integration."""
@@ -115,8 +307,8 @@ async def test_update_integration(integration_manager, mock_db, sample_integrati
         )
         
         # Verify database update
-        mock_db.execute.assert_called()
-        call_args = mock_db.execute.call_args[0]
+        mock_db.execute_in_executor.assert_called()
+        call_args = mock_db.execute_in_executor.call_args[0]
         assert "UPDATE integrations" in call_args[0]
         
         # Verify integration was updated in cache
@@ -138,7 +330,7 @@ async def test_delete_integration(integration_manager, mock_db, sample_integrati
     await integration_manager.delete_integration(sample_integration_config['integration_type'])
     
     # Verify database delete
-    mock_db.execute.assert_called_with(
+    mock_db.execute_in_executor.assert_called_with(
         "DELETE FROM integrations WHERE integration_type = ?",
         (sample_integration_config['integration_type'],)
     )
@@ -148,161 +340,212 @@ async def test_delete_integration(integration_manager, mock_db, sample_integrati
     assert integration is None
 
 @pytest.mark.asyncio
-async def test_execute_integration_cached(integration_manager, mock_redis, sample_integration_config):
+async def test_execute_integration_cached(fake_manager, fake_redis, sample_integration_config):
     """Test executing integration operation with cached result."""
     # Register integration
-    await integration_manager.register_integration(
+    await fake_manager.register_integration(
         integration_type=sample_integration_config['integration_type'],
         config=sample_integration_config['config']
     )
     
-    # Mock cached result
+    # Seed cached result
     cached_result = {'cached': 'result'}
-    mock_redis.get.return_value = json.dumps(cached_result)  # Return serialized result
+    key = make_cache_key(sample_integration_config['integration_type'], 'test_op', {'param': 'value'})
+    fake_redis.data[key] = orjson.dumps(cached_result)
     
     # Execute operation
-    result = await integration_manager.execute_integration(
+    result = await fake_manager.execute_integration(
         integration_type=sample_integration_config['integration_type'],
         operation='test_op',
         params={'param': 'value'}
     )
     
     assert result == cached_result
-    mock_redis.get.assert_called_once()
+    assert fake_redis.calls['mget'] == 1
+    assert fake_redis.calls['set_many'] == 0
+
+@pytest.mark.asyncio
+async def test_execute_integration_l1_cached(integration_manager, mock_redis, sample_integration_config):
+    """Test that repeating an operation is served in-process without touching Redis."""
+    await integration_manager.register_integration(
+        integration_type=sample_integration_config['integration_type'],
+        config=sample_integration_config['config']
+    )
+    
+    first = await integration_manager.execute_integration(
+        integration_type=sample_integration_config['integration_type'],
+        operation='test_op',
+        params={'param': 'value'}
+    )
+    mock_redis.mget.reset_mock()
+    mock_redis.set_many.reset_mock()
+    
+    second = await integration_manager.execute_integration(
+        integration_type=sample_integration_config['integration_type'],
+        operation='test_op',
+        params={'param': 'value'}
+    )
+    
+    assert second == first
+    mock_redis.mget.assert_not_called()
+    mock_redis.set_many.assert_not_called()
 
 @pytest.mark.asyncio
-async def test_execute_integration_with_retry(integration_manager, mock_redis, sample_integration_config):
+async def test_execute_integration_with_retry(fake_manager, fake_redis, sample_integration_config):
     """Test executing integration operation with retry policy."""
     # Register integration with retry policy
-    await integration_manager.register_integration(
+    await fake_manager.register_integration(
         integration_type=sample_integration_config['integration_type'],
         config=sample_integration_config['config'],
         retry_policy={'max_retries': 2, 'delay_seconds': 0.1}
     )
     
-    # Mock cache miss
-    mock_redis.get.return_value = None
-    
     # Execute operation
-    result = await integration_manager.execute_integration(
+    result = await fake_manager.execute_integration(
         integration_type=sample_integration_config['integration_type'],
         operation='test_op',
         params={'param': 'value'}
     )
     
     assert result['operation'] == 'test_op'
-    mock_redis.set.assert_called_once()
+    assert fake_redis.calls['set_many'] == 1
 
 @pytest.mark.asyncio
-async def test_execute_integration_disabled(integration_manager, sample_integration_config):
+async def test_execute_integration_disabled(fake_manager, sample_integration_config):
     """Test executing operation on disabled integration."""
     # Register disabled integration
-    await integration_manager.register_integration(
+    await fake_manager.register_integration(
         integration_type=sample_integration_config['integration_type'],
         config=sample_integration_config['config'],
         enabled=False
     )
     
-    with pytest.raises(ValueError, match="is disabled"):
-        await integration_manager.execute_integration(
+    with pytest.raises(ValueError, match="Integration test_integration is disabled"):
+        await fake_manager.execute_integration(
             integration_type=sample_integration_config['integration_type'],
             operation='test_op',
             params={}
         )
 
 @pytest.mark.asyncio
-async def test_execute_integration_not_found(integration_manager):
+async def test_execute_integration_not_found(fake_manager):
     """Test executing operation on non-existent integration."""
-    with pytest.raises(ValueError, match="not found"):
-        await integration_manager.execute_integration(
+    with pytest.raises(ValueError, match="Integration nonexistent not found"):
+        await fake_manager.execute_integration(
             integration_type='nonexistent',
             operation='test_op',
             params={}
         )
 
+@pytest.mark.real_sleep
 @pytest.mark.asyncio
-async def test_execute_integration_timeout(integration_manager, mock_redis, sample_integration_config):
+async def test_execute_integration_timeout(fake_manager, sample_integration_config):
     """Test integration operation timeout."""
     # Register integration with short timeout
-    await integration_manager.register_integration(
+    await fake_manager.register_integration(
         integration_type=sample_integration_config['integration_type'],
         config=sample_integration_config['config'],
         timeout_seconds=0.1
     )
     
-    # Mock cache miss
-    mock_redis.get.return_value = None
-    
     # Mock slow operation
     async def slow_operation(*args):
         await asyncio.sleep(0.2)
         return {'success': True}
     
-    with patch.object(integration_manager, '_execute_operation') as mock_execute:
+    with patch.object(fake_manager, '_execute_operation') as mock_execute:
         mock_execute.side_effect = slow_operation
         with pytest.raises(asyncio.TimeoutError):
-            await integration_manager.execute_integration(
+            await fake_manager.execute_integration(
                 integration_type=sample_integration_config['integration_type'],
                 operation='test_op',
                 params={}
             )
+    
+    # The timeout's cancellation must not leak into the calling task
+    assert asyncio.current_task().cancelling() == 0
+    await asyncio.sleep(0)
+
+@pytest.mark.asyncio
+async def test_execute_integration_outside_cancel_propagates(fake_manager, sample_integration_config):
+    """Test that cancelling a caller mid-operation is not turned into a timeout."""
+    await fake_manager.register_integration(
+        integration_type=sample_integration_config['integration_type'],
+        config=sample_integration_config['config']
+    )
+    started = asyncio.Event()
+    
+    async def hang(*args):
+        started.set()
+        await asyncio.Event().wait()
+    
+    with patch.object(fake_manager, '_execute_operation', side_effect=hang):
+        task = asyncio.create_task(fake_manager.execute_integration(
+            integration_type=sample_integration_config['integration_type'],
+            operation='test_op',
+            params={}
+        ))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
 
 @pytest.mark.asyncio
-async def test_update_integration_not_found(integration_manager):
+async def test_update_integration_not_found(fake_manager):
     """Test updating non-existent integration."""
     with pytest.raises(ValueError, match="not found"):
-        await integration_manager.update_integration(
+        await fake_manager.update_integration(
             integration_type='nonexistent',
             config={'new': 'config'}
         )
 
 @pytest.mark.asyncio
-async def test_delete_integration_not_found(integration_manager):
+async def test_delete_integration_not_found(fake_manager):
     """Test deleting non-existent integration."""
     with pytest.raises(ValueError, match="not found"):
-        await integration_manager.delete_integration('nonexistent')
+        await fake_manager.delete_integration('nonexistent')
 
 @pytest.mark.asyncio
-async def test_register_integration_invalid_config(integration_manager):
+async def test_register_integration_invalid_config(fake_manager):
     """Test registering integration with invalid config."""
     with pytest.raises(ValueError, match="Invalid config format"):
-        await integration_manager.register_integration(
+        await fake_manager.register_integration(
             integration_type="test",
             config="not_a_dict"  # Should be dict
         )
 
 @pytest.mark.asyncio
-async def test_register_integration_invalid_retry_policy(integration_manager):
+async def test_register_integration_invalid_retry_policy(fake_manager):
     """Test registering integration with invalid retry policy."""
     with pytest.raises(ValueError, match="Invalid retry policy"):
-        await integration_manager.register_integration(
+        await fake_manager.register_integration(
             integration_type="test",
             config={"key": "value"},
             retry_policy={"invalid": "policy"}  # Missing required fields
         )
 
 @pytest.mark.asyncio
-async def test_register_integration_invalid_timeouts(integration_manager):
+async def test_register_integration_invalid_timeouts(fake_manager):
     """Test registering integration with invalid timeouts."""
     with pytest.raises(ValueError, match="Timeout must be positive"):
-        await integration_manager.register_integration(
+        await fake_manager.register_integration(
             integration_type="test",
             config={"key": "value"},
             timeout_seconds=-1
         )
     
     with pytest.raises(ValueError, match="Cache TTL must be positive"):
-        await integration_manager.register_integration(
+        await fake_manager.register_integration(
             integration_type="test",
             config={"key": "value"},
             cache_ttl_seconds=-1
         )
 
 @pytest.mark.asyncio
-async def test_execute_integration_retry_behavior(integration_manager, mock_redis):
+async def test_execute_integration_retry_behavior(fake_manager):
     """Test detailed retry behavior."""
     # Register integration with retry policy
-    await integration_manager.register_integration(
+    await fake_manager.register_integration(
         integration_type="test",
         config={"key": "value"},
         retry_policy={
@@ -322,8 +565,8 @@ async def test_execute_integration_retry_behavior(integration_manager, mock_redi
             raise ValueError(f"Attempt {attempt} failed")
         return {"success": True}
         
-    with patch.object(integration_manager, '_execute_single_operation', side_effect=mock_operation):
-        result = await integration_manager.execute_integration(
+    with patch.object(fake_manager, '_execute_single_operation', side_effect=mock_operation):
+        result = await fake_manager.execute_integration(
             integration_type="test",
             operation="test_op",
             params={}
@@ -333,29 +576,29 @@ async def test_execute_integration_retry_behavior(integration_manager, mock_redi
         assert attempt == 3  # Two failures + one success
 
 @pytest.mark.asyncio
-async def test_cache_invalidation_on_update(integration_manager, mock_redis, sample_integration_config):
+async def test_cache_invalidation_on_update(fake_manager, fake_redis, sample_integration_config):
     """Test that cache is invalidated when integration is updated."""
     # Register integration
-    await integration_manager.register_integration(
+    await fake_manager.register_integration(
         integration_type=sample_integration_config['integration_type'],
         config=sample_integration_config['config']
     )
     
-    # Cache some results
-    mock_redis.get.return_value = '{"cached": "result"}'
+    # Seed a cached result
+    key = make_cache_key(sample_integration_config['integration_type'], "test_op", {})
+    fake_redis.data[key] = orjson.dumps({"cached": "result"})
     
     # Update integration
-    await integration_manager.update_integration(
+    await fake_manager.update_integration(
         integration_type=sample_integration_config['integration_type'],
         config={"new": "config"}
     )
     
     # Verify cache was cleared
-    mock_redis.delete.assert_called()
+    assert key not in fake_redis.data
     
     # Execute should miss cache
-    mock_redis.get.return_value = None
-    result = await integration_manager.execute_integration(
+    result = await fake_manager.execute_integration(
         integration_type=sample_integration_config['integration_type'],
         operation="test_op",
         params={}
@@ -363,23 +606,194 @@ async def test_cache_invalidation_on_update(integration_manager, mock_redis, sam
     assert "cached" not in result
 
 @pytest.mark.asyncio
-async def test_cache_expiration(integration_manager, mock_redis, sample_integration_config):
+async def test_cache_expiration(fake_manager, fake_redis, sample_integration_config):
     """Test cache expiration behavior."""
     # Register integration with short TTL
-    await integration_manager.register_integration(
+    await fake_manager.register_integration(
         integration_type=sample_integration_config['integration_type'],
         config=sample_integration_config['config'],
         cache_ttl_seconds=1
     )
     
     # Cache result
-    mock_redis.get.return_value = None
-    await integration_manager.execute_integration(
+    await fake_manager.execute_integration(
         integration_type=sample_integration_config['integration_type'],
         operation="test_op",
         params={}
     )
     
     # Verify TTL was set
-    mock_redis.set.assert_called_once()
-    assert mock_redis.set.call_args[1]['ex'] == 1
+    assert fake_redis.calls['set_many'] == 1
+    assert list(fake_redis.ttls.values()) == [1]
+
+@pytest.mark.asyncio
+async def test_concurrent_cache_access_is_batched(integration_manager, mock_redis, sample_integration_config):
+    """Test that concurrent executions share one MGET and one pipelined SET."""
+    await integration_manager.register_integration(
+        integration_type=sample_integration_config['integration_type'],
+        config=sample_integration_config['config']
+    )
+    
+    results = await asyncio.gather(*(
+        integration_manager.execute_integration(
+            integration_type=sample_integration_config['integration_type'],
+            operation="test_op",
+            params={'index': i}
+        )
+        for i in range(10)
+    ))
+    
+    assert [r['params']['index'] for r in results] == list(range(10))
+    mock_redis.mget.assert_called_once()
+    assert len(mock_redis.mget.call_args[0][0]) == 10
+    mock_redis.set_many.assert_called_once()
+    assert len(mock_redis.set_many.call_args[0][0]) == 10
+
+@pytest.mark.asyncio
+async def test_cache_flush_does_not_sleep(fake_manager, fake_redis, monkeypatch):
+    """Test that a cache read is flushed on the next loop pass with no batching timer."""
+    sleeps = []
+    
+    async def record_sleep(delay, result=None):
+        sleeps.append(delay)
+        return result
+    
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+    
+    assert await fake_manager._cache_get("key") is None
+    assert fake_redis.calls['mget'] == 1
+    assert sleeps == []
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("result", [{}, [], 0, "", "plain text", "123"])
+async def test_cached_results_round_trip(fake_manager, sample_integration_config, result):
+    """Test that falsy and string results are served from Redis unchanged."""
+    integration_type = sample_integration_config['integration_type']
+    await fake_manager.register_integration(integration_type=integration_type, config={})
+    
+    execute = AsyncMock(return_value=result)
+    with patch.object(fake_manager, '_execute_operation', execute):
+        assert await fake_manager.execute_integration(integration_type, "op", {}) == result
+        fake_manager._l1.clear()  # Force the next call through Redis
+        cached = await fake_manager.execute_integration(integration_type, "op", {})
+    
+    assert cached == result
+    assert type(cached) is type(result)
+    execute.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_shared_cache_read_survives_cancelled_caller(fake_manager, fake_redis):
+    """Test that cancelling one caller does not cancel a read other callers share."""
+    release = asyncio.Event()
+    
+    async def slow_mget(keys):
+        await release.wait()
+        return ["value"] * len(keys)
+    
+    fake_redis.mget = slow_mget
+    first = asyncio.create_task(fake_manager._cache_get("shared"))
+    second = asyncio.create_task(fake_manager._cache_get("shared"))
+    await _real_sleep(0)
+    
+    first.cancel()
+    release.set()
+    
+    assert await second == "value"
+    assert first.cancelled()
+
+@pytest.mark.asyncio
+async def test_cancelled_cache_flush_does_not_hang_callers(fake_manager):
+    """Test that queued cache requests fail instead of hanging when the flush is cancelled."""
+    read = asyncio.create_task(fake_manager._cache_get("key"))
+    write = asyncio.create_task(fake_manager._cache_set("other", "value", 1))
+    await _real_sleep(0)
+    
+    fake_manager._flush_task.cancel()
+    
+    for task in (read, write):
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=1)
+    assert not fake_manager._pending_gets
+    assert not fake_manager._pending_sets
+
+@pytest.mark.asyncio
+async def test_slow_registry_write_does_not_block_other_types(fake_manager, fake_db):
+    """Test that a slow database write does not hold up registering another type."""
+    first, second = "test_integration", "other_integration"
+    release = asyncio.Event()
+    fast_execute = fake_db.execute_in_executor
+    
+    async def execute(*args):
+        # Only the first write, for the first type, is slow
+        if fake_db.calls["execute_in_executor"] == 0:
+            fake_db.calls["execute_in_executor"] += 1
+            await release.wait()
+            return None
+        return await fast_execute(*args)
+    
+    fake_db.execute_in_executor = execute
+    slow = asyncio.create_task(
+        fake_manager.register_integration(integration_type=first, config={})
+    )
+    await _real_sleep(0)
+    
+    # Completes while the first write is stuck
+    await asyncio.wait_for(
+        fake_manager.register_integration(integration_type=second, config={}),
+        timeout=1
+    )
+    assert await fake_manager.get_integration(second) is not None
+    assert await fake_manager.get_integration(first) is None
+    
+    release.set()
+    await slow
+    assert await fake_manager.get_integration(first) is not None
+
+def test_make_cache_key_is_order_independent():
+    """Test that cache keys ignore parameter ordering and handle nested values."""
+    assert make_cache_key("t", "op", {"a": 1, "b": 2}) == make_cache_key("t", "op", {"b": 2, "a": 1})
+    assert make_cache_key("t", "op", {"a": 1}) != make_cache_key("t", "other", {"a": 1})
+    
+    nested = make_cache_key("t", "op", {"a": {"y": 1, "x": [1, 2]}})
+    assert nested == 'integration:t:op:{"a":{"x":[1,2],"y":1}}'
+
+def test_make_cache_key_distinguishes_value_types():
+    """Test that equal-comparing values of different types get distinct keys."""
+    keys = {make_cache_key("t", "op", {"x": value}) for value in (True, 1, 1.0)}
+    assert len(keys) == 3
+
+def test_make_cache_key_normalizes_sets():
+    """Test that sets are keyed by their sorted contents."""
+    assert make_cache_key("t", "op", {"a": {2, 1}}) == 'integration:t:op:{"a":[1,2]}'
+    assert make_cache_key("t", "op", {"a": frozenset("ba")}) == make_cache_key("t", "op", {"a": {"a", "b"}})
+
+@pytest.mark.parametrize("params", [{"a": object()}, {(1, 2): "v"}])
+def test_make_cache_key_rejects_unserializable_params(params):
+    """Test that params without a stable encoding are rejected instead of keyed by repr."""
+    with pytest.raises(TypeError):
+        make_cache_key("t", "op", params)
+
+@pytest.mark.asyncio
+async def test_execute_integration_batch_cached(integration_manager, mock_redis, sample_integration_config):
+    """Test that a batch of cached operations is served by a single MGET."""
+    integration_type = sample_integration_config['integration_type']
+    await integration_manager.register_integration(
+        integration_type=integration_type,
+        config=sample_integration_config['config']
+    )
+    
+    operations = [("op_a", {"id": 1}), ("op_b", {"id": 2}), ("op_c", {"id": 3})]
+    mock_redis.mget.side_effect = lambda keys: [{"key": key} for key in keys]  # Decoded by RedisClient
+    
+    results = await asyncio.gather(*(
+        integration_manager.execute_integration(integration_type, operation, params)
+        for operation, params in operations
+    ))
+    
+    expected_keys = [
+        make_cache_key(integration_type, operation, params)
+        for operation, params in operations
+    ]
+    mock_redis.mget.assert_called_once_with(expected_keys)
+    assert [r["key"] for r in results] == expected_keys
+    mock_redis.set_many.assert_not_called()
@@ -3,39 +3,30 @@ Integration tests for memory management and model service.
 """
 import pytest
 import asyncio
-import time
 from typing import Dict, Any, List
 from src.agent_runtime.orchestrator import Memory, Thought, ThoughtType
 from src.agent_runtime.model_service import MockModelService, ModelMetrics
 from src.tools.base import ToolRegistry
 
+@pytest.fixture
+def mock_model_service():
+    """Mock model service with fresh metrics."""
+    return MockModelService({"model": "test"})
+
 @pytest.mark.asyncio
 async def test_memory_management():
     """Test memory management in orchestrator."""
     memory = Memory(max_short_term_items=3)
-    thought = Thought(
-        type=ThoughtType.OBSERVATION,
-        content="test",
-        timestamp=time.time()
-    )
+    thoughts = [
+        Thought(type=ThoughtType.OBSERVATION, content="test", timestamp=0.0),
+        Thought(type=ThoughtType.THOUGHT, content="test2", timestamp=1.0),
+        Thought(type=ThoughtType.ACTION, content="test3", timestamp=2.0),
+        Thought(type=ThoughtType.OBSERVATION, content="test4", timestamp=3.0),
+    ]
     
-    # Test memory limits
-    memory.add_thought(thought)
-    memory.add_thought(Thought(
-        type=ThoughtType.THOUGHT,
-        content="test2",
-        timestamp=time.time()
-    ))
-    memory.add_thought(Thought(
-        type=ThoughtType.ACTION,
-        content="test3",
-        timestamp=time.time()
-    ))
-    memory.add_thought(Thought(
-        type=ThoughtType.OBSERVATION,
-        content="test4",
-        timestamp=time.time()
-    ))  # Should remove oldest
+    # Test memory limits; the last add should remove the oldest
+    for thought in thoughts:
+        memory.add_thought(thought)
     
     recent = memory.get_recent_thoughts(2)
     assert len(recent) == 2
@@ -49,9 +40,22 @@ async def test_memory_management():
     assert all_thoughts[-1].content == "test4"
 
 @pytest.mark.asyncio
-async def test_batch_model_invocation():
+@pytest.mark.parametrize("n", [1000, 10000])
+async def test_memory_keeps_newest_thoughts_in_order(n):
+    """Test a full memory evicts the oldest thoughts and keeps the rest in order."""
+    memory = Memory(max_short_term_items=n // 2)
+    for i in range(n):
+        memory.add_thought(
+            Thought(type=ThoughtType.THOUGHT, content=str(i), timestamp=float(i))
+        )
+    
+    recent = memory.get_recent_thoughts(n)
+    assert [t.content for t in recent] == [str(i) for i in range(n // 2, n)]
+
+@pytest.mark.asyncio
+async def test_batch_model_invocation(mock_model_service):
     """Test batch model invocation."""
-    service = MockModelService({"model": "test"})
+    service = mock_model_service
     prompts = ["test1", "test2", "test3"]
     
     results = await service.batch_invoke(prompts)
@@ -71,9 +75,42 @@ async def test_batch_model_invocation():
     assert service.metrics.total_latency >= 0
 
 @pytest.mark.asyncio
-async def test_model_error_handling():
+@pytest.mark.parametrize("n", [1, 8, 64])
+async def test_batch_model_invocation_concurrent(mock_model_service, monkeypatch, n):
+    """Test batch invocation does not run prompts serially."""
+    real_sleep = asyncio.sleep
+    in_flight = 0
+    peak = 0
+    
+    async def tracking_sleep(delay, result=None):
+        # Count prompts waiting on simulated latency at the same time
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await real_sleep(0)
+        in_flight -= 1
+        return result
+    
+    monkeypatch.setattr(asyncio, "sleep", tracking_sleep)
+    results = await mock_model_service.batch_invoke([f"p{i}" for i in range(n)])
+    
+    assert results == [f"Mock response {i}: p{i}" for i in range(n)]
+    # The whole batch is one request, with every prompt in flight at once
+    assert mock_model_service.metrics.total_requests == 1
+    assert mock_model_service.metrics.successful_requests == 1
+    assert peak == n
+
+@pytest.mark.asyncio
+async def test_batch_model_invocation_empty(mock_model_service):
+    """Test an empty batch returns no responses and records nothing."""
+    assert await mock_model_service.batch_invoke([]) == []
+    assert mock_model_service.metrics.total_requests == 0
+    assert mock_model_service.metrics.failed_requests == 0
+
+@pytest.mark.asyncio
+async def test_model_error_handling(mock_model_service):
     """Test model error handling."""
-    service = MockModelService({"model": "test"})
+    service = mock_model_service
     
     # Test invalid prompt
     with pytest.raises(ValueError):
@@ -83,9 +120,9 @@ async def test_model_error_handling():
     assert service.metrics.failed_requests > 0
 
 @pytest.mark.asyncio
-async def test_model_with_different_parameters():
+async def test_model_with_different_parameters(mock_model_service):
     """Test model with different parameter configurations."""
-    service = MockModelService({"model": "test"})
+    service = mock_model_service
     
     # Test temperature variations
     result1 = await service.invoke("test", {"temperature": 0.1})
@@ -10,29 +10,35 @@ from src.integrations.slack import SlackIntegration
 def slack():
     return SlackIntegration("https://hooks.slack.com/services/TEST/TEST/test")
 
-@pytest.mark.asyncio
-async def test_send_message(slack):
+@pytest.fixture
+def slack_with_mock(slack):
+    """Slack integration with _make_request patched."""
     with patch.object(slack, '_make_request') as mock_request:
-        mock_request.return_value = {"ok": True}
-        
-        result = await slack.send_message(
-            text="Test Message",
-            channel="#test",
-            blocks=[{"type": "section", "text": {"type": "mrkdwn", "text": "Test"}}],
-            thread_ts="1234567890.123456"
-        )
-        
-        mock_request.assert_called_once_with(
-            "POST",
-            slack.webhook_url,
-            data={
-                "text": "Test Message",
-                "channel": "#test",
-                "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": "Test"}}],
-                "thread_ts": "1234567890.123456"
-            }
-        )
-        assert result["ok"] is True
+        yield slack, mock_request
+
+@pytest.mark.asyncio
+async def test_send_message(slack_with_mock):
+    slack, mock_request = slack_with_mock
+    mock_request.return_value = {"ok": True}
+    
+    result = await slack.send_message(
+        text="Test Message",
+        channel="#test",
+        blocks=[{"type": "section", "text": {"type": "mrkdwn", "text": "Test"}}],
+        thread_ts="1234567890.123456"
+    )
+    
+    mock_request.assert_called_once_with(
+        "POST",
+        slack.webhook_url,
+        data={
+            "text": "Test Message",
+            "channel": "#test",
+            "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": "Test"}}],
+            "thread_ts": "1234567890.123456"
+        }
+    )
+    assert result["ok"] is True
 
 @pytest.mark.asyncio
 async def test_send_notification(slack):
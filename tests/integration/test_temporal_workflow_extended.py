@@ -3,19 +3,39 @@ Extended integration tests for temporal workflows.
 """
 import pytest
 import asyncio
-import uuid
+import os
 from typing import Dict, Any
 from tests.fixtures.mock_services import MockTemporalService
 
 pytestmark = pytest.mark.asyncio
 
+_real_sleep = asyncio.sleep
+
+class VirtualClock:
+    """Manually advanced clock standing in for wall-clock sleeps."""
+    def __init__(self):
+        self.now = 0.0
+        
+    async def sleep(self, delay: float, result: Any = None) -> Any:
+        """Advance virtual time and yield to the loop once."""
+        self.now += max(delay, 0)
+        await _real_sleep(0)
+        return result
+
+@pytest.fixture
+def virtual_clock(monkeypatch):
+    """Collapse asyncio.sleep calls in a test to a single loop iteration."""
+    clock = VirtualClock()
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    return clock
+
 @pytest.fixture
 def mock_temporal_service():
     return MockTemporalService()
 
-async def test_workflow_cancellation(mock_temporal_service):
+async def test_workflow_cancellation(mock_temporal_service, virtual_clock):
     """Test workflow cancellation handling."""
-    workflow_id = str(uuid.uuid4())
+    workflow_id = os.urandom(16).hex()
     
     # Start workflow
     task = asyncio.create_task(
@@ -35,9 +55,9 @@ async def test_workflow_cancellation(mock_temporal_service):
         state = await mock_temporal_service.get_workflow_state(workflow_id)
         assert state["status"] == "cancelled"
 
-async def test_workflow_state_persistence(mock_temporal_service):
+async def test_workflow_state_persistence(mock_temporal_service, virtual_clock):
     """Test workflow state persistence."""
-    workflow_id = str(uuid.uuid4())
+    workflow_id = os.urandom(16).hex()
     
     # Execute workflow
     result = await mock_temporal_service.execute_workflow(
@@ -52,12 +72,27 @@ async def test_workflow_state_persistence(mock_temporal_service):
     
     # Verify state after some time
     await asyncio.sleep(0.1)
+    assert virtual_clock.now == pytest.approx(0.1)
     state = await mock_temporal_service.get_workflow_state(workflow_id)
     assert state["status"] == "success"
 
-async def test_concurrent_workflow_execution(mock_temporal_service):
-    """Test concurrent workflow execution."""
-    workflow_ids = [str(uuid.uuid4()) for _ in range(3)]
+async def gather_limit(*aws, max_con: int):
+    """Gather awaitables with at most max_con running at once."""
+    semaphore = asyncio.Semaphore(max_con)
+    
+    async def limited(aw):
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(*(limited(aw) for aw in aws))
+
+@pytest.mark.parametrize("n", [3, 64, 512])
+@pytest.mark.parametrize("max_con", [None, 32])
+async def test_concurrent_workflow_execution(mock_temporal_service, n, max_con):
+    """Test concurrent workflow execution, unbounded and bounded."""
+    # One urandom read for all IDs
+    raw = os.urandom(16 * n).hex()
+    workflow_ids = [raw[i * 32:(i + 1) * 32] for i in range(n)]
     
     # Start multiple workflows
     tasks = [
@@ -69,9 +104,13 @@ async def test_concurrent_workflow_execution(mock_temporal_service):
     ]
     
     # Wait for all workflows
-    results = await asyncio.gather(*tasks)
+    if max_con is None:
+        results = await asyncio.gather(*tasks)
+    else:
+        results = await gather_limit(*tasks, max_con=max_con)
     
     # Verify all workflows completed
+    assert len(results) == n
     assert all(r["status"] == "success" for r in results)
     
     # Verify all states
@@ -83,7 +122,7 @@ async def test_concurrent_workflow_execution(mock_temporal_service):
 
 async def test_tool_registry_integration(mock_temporal_service):
     """Test tool registry integration with workflow."""
-    workflow_id = str(uuid.uuid4())
+    workflow_id = os.urandom(16).hex()
     result = await mock_temporal_service.execute_workflow(
         workflow_id=workflow_id,
         input_data={
@@ -99,3 +138,4 @@ async def test_tool_registry_integration(mock_temporal_service):
     # Test tool execution result
     state = await mock_temporal_service.get_workflow_state(workflow_id)
     assert state["status"] == "success"
+    assert state["tool_results"] == result["tool_results"]
@@ -1,16 +1,12 @@
 import pytest
+from dataclasses import replace
 from src.workflows.patterns_mock import ChainOfThought, ReflectiveExecution
-from src.agent_runtime.context_mock import AgentContext, AgentState
 
 @pytest.mark.asyncio
-async def test_chain_of_thought_workflow(mock_model_client, mock_redis_service):
+async def test_chain_of_thought_workflow(mock_model_client, mock_redis_service, base_context):
     """Test chain of thought workflow pattern."""
     workflow = ChainOfThought(mock_model_client, mock_redis_service)
-    context = AgentContext(
-        state=AgentState(tenant_id="test"),
-        model_config={"model": "gpt-4"},
-        tool_config={}
-    )
+    context = base_context
     
     result = await workflow.execute(context)
     assert result["status"] == "success"
@@ -18,14 +14,10 @@ async def test_chain_of_thought_workflow(mock_model_client, mock_redis_service):
     assert "tool_result" in result
 
 @pytest.mark.asyncio
-async def test_reflective_execution(mock_model_client, mock_redis_service):
+async def test_reflective_execution(mock_model_client, mock_redis_service, base_context):
     """Test reflective execution workflow pattern."""
     workflow = ReflectiveExecution(mock_model_client, mock_redis_service)
-    context = AgentContext(
-        state=AgentState(tenant_id="test"),
-        model_config={"model": "gpt-4"},
-        tool_config={}
-    )
+    context = base_context
     
     result = await workflow.execute(context)
     assert result["status"] == "success"
@@ -33,14 +25,10 @@ async def test_reflective_execution(mock_model_client, mock_redis_service):
     assert "improved_result" in result
 
 @pytest.mark.asyncio
-async def test_workflow_error_handling(mock_model_client, mock_redis_service):
+async def test_workflow_error_handling(mock_model_client, mock_redis_service, base_context):
     """Test workflow error handling."""
     workflow = ReflectiveExecution(mock_model_client, mock_redis_service)
-    context = AgentContext(
-        state=AgentState(tenant_id="test"),
-        model_config={"model": "gpt-4"},
-        tool_config={"raise_error": True}  # Trigger error condition
-    )
+    context = replace(base_context, tool_config={"raise_error": True})  # Trigger error condition
     
     try:
         await workflow.execute(context)
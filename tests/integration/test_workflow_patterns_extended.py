@@ -1,16 +1,12 @@
 import pytest
+from dataclasses import replace
 from src.workflows.patterns_mock import ChainOfThought, ReflectiveExecution
-from src.agent_runtime.context_mock import AgentContext, AgentState
 
 @pytest.mark.asyncio
-async def test_workflow_with_tool_config(mock_model_client, mock_redis_service):
+async def test_workflow_with_tool_config(mock_model_client, mock_redis_service, base_context):
     """Test workflow with tool configuration."""
     workflow = ChainOfThought(mock_model_client, mock_redis_service)
-    context = AgentContext(
-        state=AgentState(tenant_id="test"),
-        model_config={"model": "gpt-4"},
-        tool_config={"max_tokens": 100, "temperature": 0.7}
-    )
+    context = replace(base_context, tool_config={"max_tokens": 100, "temperature": 0.7})
     
     result = await workflow.execute(context)
     assert result["status"] == "success"
@@ -18,14 +14,10 @@ async def test_workflow_with_tool_config(mock_model_client, mock_redis_service):
     assert result["tool_config"]["temperature"] == 0.7
 
 @pytest.mark.asyncio
-async def test_reflective_execution_max_iterations(mock_model_client, mock_redis_service):
+async def test_reflective_execution_max_iterations(mock_model_client, mock_redis_service, base_context):
     """Test reflective execution with max iterations."""
     workflow = ReflectiveExecution(mock_model_client, mock_redis_service, max_iterations=5)
-    context = AgentContext(
-        state=AgentState(tenant_id="test"),
-        model_config={"model": "gpt-4"},
-        tool_config={}
-    )
+    context = base_context
     
     result = await workflow.execute(context)
     assert result["iterations"] <= 5
@@ -33,17 +25,12 @@ async def test_reflective_execution_max_iterations(mock_model_client, mock_redis
     assert "final_result" in result
 
 @pytest.mark.asyncio
-async def test_workflow_with_state_tracking(mock_model_client, mock_redis_service):
+async def test_workflow_with_state_tracking(mock_model_client, mock_redis_service, base_context):
     """Test workflow with state tracking."""
     workflow = ChainOfThought(mock_model_client, mock_redis_service)
-    context = AgentContext(
-        state=AgentState(
-            tenant_id="test",
-            workflow_id="test_workflow",
-            step_id="step_1"
-        ),
-        model_config={"model": "gpt-4"},
-        tool_config={}
+    context = replace(
+        base_context,
+        state=replace(base_context.state, workflow_id="test_workflow", step_id="step_1")
     )
     
     result = await workflow.execute(context)
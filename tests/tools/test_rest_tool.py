@@ -0,0 +1,44 @@
+"""
+Tests for REST tool session ownership.
+"""
+
+import aiohttp
+import pytest
+from src.tools.rest_tool import RESTTool
+
+@pytest.mark.asyncio
+async def test_cleanup_leaves_caller_session_open():
+    """Test that a session passed in by the caller survives cleanup."""
+    async with aiohttp.ClientSession() as session:
+        tool = RESTTool(session=session)
+        await tool._ensure_session()
+        
+        await tool.cleanup()
+        
+        assert tool.session is session
+        assert not session.closed
+
+@pytest.mark.asyncio
+async def test_cleanup_closes_owned_session():
+    """Test that a session the tool created itself is closed on cleanup."""
+    tool = RESTTool()
+    await tool._ensure_session()
+    session = tool.session
+    
+    await tool.cleanup()
+    
+    assert session.closed
+
+@pytest.mark.asyncio
+async def test_closed_caller_session_is_replaced_and_owned():
+    """Test that a closed caller session is swapped for one the tool closes."""
+    session = aiohttp.ClientSession()
+    await session.close()
+    tool = RESTTool(session=session)
+    
+    await tool._ensure_session()
+    replacement = tool.session
+    await tool.cleanup()
+    
+    assert replacement is not session
+    assert replacement.closed
@@ -0,0 +1,60 @@
+"""Shared fixtures for workflow tests."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.agent_runtime.context import AgentContext, AgentState
+from src.agent_runtime.reasoning import ReasoningEngine
+from src.infrastructure.event_store import EventStore
+
+def _event_ids(events):
+    """store_event_many stand-in returning one ID per event."""
+    return [f"event-{i}" for i in range(len(events))]
+
+@pytest.fixture
+def sample_context():
+    """Sample agent context."""
+    state = AgentState(
+        tenant_id="test_tenant",
+        variables={
+            "session_id": "test_session",
+            "user_id": "test_user"
+        }
+    )
+    return AgentContext(
+        state=state,
+        model_config={
+            "model": "gpt-4",
+            "temperature": 0.7
+        },
+        tool_config={
+            "max_retries": 3,
+            "timeout": 30
+        },
+        workflow_config={},
+        tenant_config=None
+    )
+
+@pytest.fixture
+def mock_reasoning():
+    """Mock reasoning engine."""
+    mock = AsyncMock(spec=ReasoningEngine)
+    mock.reason = AsyncMock()
+    mock.reflect = AsyncMock()
+    return mock
+
+@pytest.fixture
+def mock_event_store():
+    """Mock event store whose batched writes return one ID per event."""
+    mock = AsyncMock(spec=EventStore)
+    mock.store_event = AsyncMock()
+    mock.store_event_many = AsyncMock(side_effect=_event_ids)
+    mock.list_workflows = AsyncMock(return_value=[])
+    return mock
+
+@pytest.fixture
+def mock_db():
+    """Mock database connection whose queries succeed."""
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value={"status": "success"})
+    return db
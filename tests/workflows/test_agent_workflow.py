@@ -1,40 +1,22 @@
 """Tests for agent workflow."""
 
 import pytest
-import asyncio
-from unittest.mock import patch, AsyncMock, MagicMock
-from uuid import uuid4
+from dataclasses import replace
+from datetime import timedelta
+from types import MappingProxyType
+from unittest.mock import AsyncMock
 
 from temporalio import workflow
-from temporalio.common import RetryPolicy
-from temporalio.exceptions import ActivityError, ApplicationError
+from temporalio.exceptions import ActivityError, RetryState
 
-from src.agent_runtime.context import AgentContext, AgentState
-from src.agent_runtime.reasoning import ReasoningEngine
-from src.workflows.agent_workflow import AgentWorkflow
+from src.workflows.agent_workflow import ACTIVITY_RETRY_POLICY, AgentWorkflow
 
 @pytest.fixture
-def sample_context():
-    """Sample agent context."""
-    state = AgentState(
-        tenant_id="test_tenant",
-        variables={
-            "session_id": "test_session",
-            "user_id": "test_user"
-        }
-    )
-    return AgentContext(
-        state=state,
-        model_config={
-            "model": "gpt-4",
-            "temperature": 0.7
-        },
-        tool_config={
-            "max_retries": 3,
-            "timeout": 30
-        },
-        workflow_config={},
-        tenant_config=None
+def run_context(sample_context):
+    """Sample context with an empty tool result list, which the workflow appends to."""
+    return replace(
+        sample_context,
+        state=replace(sample_context.state, tool_results=[])
     )
 
 @pytest.fixture
@@ -42,59 +24,104 @@ def agent_workflow():
     """Create agent workflow instance."""
     return AgentWorkflow()
 
-@pytest.mark.asyncio
-async def test_workflow_retry_policy(agent_workflow, sample_context):
-    """Test workflow retry policy."""
-    activity_calls = []
-    state_attempts = {}
+@pytest.fixture
+def activity_mocks(monkeypatch):
+    """Replace Temporal's activity dispatch; returns the (remote, local) mocks."""
+    remote = AsyncMock()
+    local = AsyncMock()
+    monkeypatch.setattr(workflow, 'execute_activity', remote)
+    monkeypatch.setattr(workflow, 'execute_local_activity', local)
+    return remote, local
+
+# Canned activity results, built once and read-only; update_state echoes
+# the state it was given
+TOOL_SELECTION = MappingProxyType({
+    "tool_selection": MappingProxyType({"name": "test_tool", "params": MappingProxyType({})})
+})
+SUCCESS_RESULT = MappingProxyType({"status": "success", "result": "test result"})
+ACTIVITY_RESULTS = MappingProxyType({
+    'execute_reasoning': lambda context: TOOL_SELECTION,
+    'execute_tool': lambda params: SUCCESS_RESULT,
+    'process_result': lambda params: SUCCESS_RESULT
+})
 
-    async def mock_activity(*args, **kwargs):
-        activity_fn = args[0]
-        activity_args = args[1:]
-        
-        # Record the activity call
-        activity_calls.append(activity_fn.__name__)
-        
-        if activity_fn.__name__ == 'update_state':
-            state = activity_args[0]
-            state_key = f"{activity_fn.__name__}_{state.current_step}"
-            
-            # Initialize attempt counter for this state
-            if state_key not in state_attempts:
-                state_attempts[state_key] = 1
-            else:
-                state_attempts[state_key] += 1
+def _activity_error(activity_type: str) -> ActivityError:
+    """The error Temporal raises in the workflow once an activity's retries run out."""
+    return ActivityError(
+        f"{activity_type} failed",
+        scheduled_event_id=1,
+        started_event_id=2,
+        identity="test-worker",
+        activity_type=activity_type,
+        activity_id="1",
+        retry_state=RetryState.MAXIMUM_ATTEMPTS_REACHED
+    )
 
-            # Fail first 4 attempts for each state
-            if state_attempts[state_key] <= 4:
-                raise ApplicationError(f"Temporary error (attempt {state_attempts[state_key]} for {state.current_step})")
-            return activity_args[0]
-        elif activity_fn.__name__ == 'execute_reasoning':
-            return {"tool_selection": {"name": "test_tool", "params": {}}}
-        elif activity_fn.__name__ == 'execute_tool':
-            return {"status": "success", "result": "test result"}
-        elif activity_fn.__name__ == 'process_result':
-            return {"status": "success", "result": "test result"}
-        return activity_args[0]
+async def _dispatch(activity_fn, arg, **kwargs):
+    """Return each activity's canned result; update_state echoes its state."""
+    result = ACTIVITY_RESULTS.get(activity_fn.__name__)
+    return result(arg) if result is not None else arg
 
-    mock_execute_activity = AsyncMock(side_effect=mock_activity)
+def test_activity_retry_policy_backoff():
+    """Test the backoff Temporal applies between failed attempts."""
+    # Waits 1s after the first failed attempt, doubling each time up to a
+    # 5s cap, and gives up after the fifth attempt
+    assert ACTIVITY_RETRY_POLICY.initial_interval == timedelta(seconds=1)
+    assert ACTIVITY_RETRY_POLICY.backoff_coefficient == 2.0
+    assert ACTIVITY_RETRY_POLICY.maximum_interval == timedelta(seconds=5)
+    assert ACTIVITY_RETRY_POLICY.maximum_attempts == 5
 
-    # Let Temporal handle the retry policy
-    with patch('temporalio.workflow.execute_activity', mock_execute_activity):
-        result = await agent_workflow.run(sample_context)
+async def test_workflow_retry_policy(agent_workflow, run_context, activity_mocks):
+    """Test that every step runs under the shared retry policy and the workflow completes."""
+    for mock in activity_mocks:
+        mock.side_effect = _dispatch
+    
+    result = await agent_workflow.run(run_context)
+    
+    assert result == {
+        "status": "completed",
+        "result": SUCCESS_RESULT,
+        "state_id": str(run_context.state.id)
+    }
+    assert run_context.state.current_step == "completed"
+    assert run_context.state.tool_results == [SUCCESS_RESULT]
+    for mock in activity_mocks:
+        for call in mock.call_args_list:
+            assert call.kwargs["retry_policy"] is ACTIVITY_RETRY_POLICY
 
-        assert result is not None
-        assert result["status"] == "completed"
-        
-        # Check that update_state was called enough times
-        update_state_calls = len([x for x in activity_calls if x == 'update_state'])
-        assert update_state_calls >= 20, f"Expected at least 20 update_state calls, got {update_state_calls}"
-        
-        # Verify other activities were called exactly once
-        assert activity_calls.count('execute_reasoning') == 1
-        assert activity_calls.count('execute_tool') == 1
-        assert activity_calls.count('process_result') == 1
+async def test_workflow_retries_exhausted(agent_workflow, run_context, activity_mocks):
+    """Test that a step whose retries run out fails the workflow and records why."""
+    remote, local = activity_mocks
+    error = _activity_error("execute_tool")
+    
+    async def dispatch(activity_fn, arg, **kwargs):
+        if activity_fn.__name__ == "execute_tool":
+            raise error
+        return await _dispatch(activity_fn, arg, **kwargs)
+    
+    remote.side_effect = dispatch
+    local.side_effect = _dispatch
+    
+    with pytest.raises(ActivityError) as exc_info:
+        await agent_workflow.run(run_context)
+    
+    assert exc_info.value is error
+    assert exc_info.value.retry_state == RetryState.MAXIMUM_ATTEMPTS_REACHED
+    assert run_context.state.current_step == "failed"
+    assert run_context.state.error == str(error)
+    assert run_context.state.tool_results == []
+    # The failure itself is written to state last
+    assert local.call_args.args[1].current_step == "failed"
 
-        # Verify each state was retried 5 times
-        for state_key, attempts in state_attempts.items():
-            assert attempts == 5, f"State {state_key} had {attempts} attempts, expected 5"
+async def test_workflow_state_write_exhausted(agent_workflow, run_context, activity_mocks):
+    """Test that a state write whose retries run out stops the workflow before any step."""
+    remote, local = activity_mocks
+    local.side_effect = _activity_error("update_state")
+    remote.side_effect = _dispatch
+    
+    with pytest.raises(ActivityError):
+        await agent_workflow.run(run_context)
+    
+    assert run_context.state.current_step == "failed"
+    assert run_context.state.tool_results == []
+    remote.assert_not_called()
@@ -2,60 +2,40 @@
 
 import asyncio
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
-from src.agent_runtime.context import AgentContext, AgentState
+from prometheus_client import REGISTRY
+
 from src.agent_runtime.reasoning import ReasoningEngine
-from src.infrastructure.event_store import EventStore
 from src.workflows.patterns import (
+    PATTERN_OPERATIONS,
+    PATTERN_STEPS,
     ChainOfThought,
     ReflectiveExecution,
     ParallelReasoning,
     WorkflowPatterns
 )
 
-@pytest.fixture
-def mock_reasoning():
-    """Mock reasoning engine."""
-    mock = AsyncMock(spec=ReasoningEngine)
-    mock.reason = AsyncMock()
-    mock.reflect = AsyncMock()
-    return mock
-
-@pytest.fixture
-def mock_event_store():
-    """Mock event store."""
-    mock = AsyncMock(spec=EventStore)
-    mock.store_event = AsyncMock()
-    mock.list_workflows = AsyncMock()
-    return mock
-
-@pytest.fixture
-def sample_context():
-    """Sample agent context."""
-    state = AgentState(
-        tenant_id="test_tenant",
-        variables={
-            "session_id": "test_session",
-            "user_id": "test_user"
-        }
-    )
-    return AgentContext(
-        state=state,
-        model_config={
-            "model": "gpt-4",
-            "temperature": 0.7
-        },
-        tool_config={
-            "max_retries": 3,
-            "timeout": 30
-        },
-        workflow_config={},
-        tenant_config=None
-    )
+# Reasoning approaches shared across tests, defined once per module
+async def approach1(context):
+    return {"thought": "approach 1", "confidence": 0.7}
+
+async def approach2(context):
+    return {"thought": "approach 2", "confidence": 0.8}
+
+async def good_approach(context):
+    return {"thought": "good", "confidence": 0.8}
+
+async def bad_approach(context):
+    raise ValueError("Test error")
+
+async def approach(context):
+    return {"thought": "test", "confidence": 0.5}
+
+async def other_approach(context):
+    return {"thought": "other", "confidence": 0.5}
 
-@pytest.mark.asyncio
 async def test_chain_of_thought(mock_reasoning, mock_event_store, sample_context):
     """Test chain-of-thought pattern."""
     pattern = ChainOfThought(mock_reasoning)
@@ -78,7 +58,39 @@ async def test_chain_of_thought(mock_reasoning, mock_event_store, sample_context
     mock_reasoning.reason.assert_called_once()
     mock_reasoning.reflect.assert_called_once()
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize("pattern_cls,label", [
+    (ChainOfThought, "chain_of_thought"),
+    (ReflectiveExecution, "reflective_execution"),
+    (ParallelReasoning, "parallel_reasoning")
+])
+def test_pattern_metric_children_use_pattern_label(mock_reasoning, pattern_cls, label):
+    """Test each pattern pre-binds the metric children for its own label."""
+    if pattern_cls is ParallelReasoning:
+        pattern = pattern_cls(mock_reasoning, [approach])
+    else:
+        pattern = pattern_cls(mock_reasoning)
+    
+    assert pattern._m_executed is PATTERN_OPERATIONS.labels(pattern=label, operation="execute")
+    assert pattern._m_steps is PATTERN_STEPS.labels(pattern=label)
+
+async def test_chain_of_thought_records_reasoning_steps(mock_reasoning, sample_context):
+    """Test a chain-of-thought run is exported as two reasoning steps."""
+    pattern = ChainOfThought(mock_reasoning)
+    mock_reasoning.reason.return_value = {"id": "test_id", "response": "test response"}
+    mock_reasoning.reflect.return_value = {"reflection": "test reflection"}
+    labels = {"pattern": "chain_of_thought"}
+    
+    def sample(name):
+        return REGISTRY.get_sample_value(name, labels) or 0
+    
+    count = sample("workflow_pattern_steps_count")
+    total = sample("workflow_pattern_steps_sum")
+    
+    await pattern.execute(sample_context, "test prompt")
+    
+    assert sample("workflow_pattern_steps_count") == count + 1
+    assert sample("workflow_pattern_steps_sum") == total + 2
+
 async def test_reflective_execution(mock_reasoning, mock_event_store, sample_context):
     """Test reflective execution pattern."""
     pattern = ReflectiveExecution(mock_reasoning)
@@ -104,15 +116,70 @@ async def test_reflective_execution(mock_reasoning, mock_event_store, sample_con
     assert mock_reasoning.reason.call_count == 4  # Initial + 3 improvements
     assert mock_reasoning.reflect.call_count == 3
 
-@pytest.mark.asyncio
-async def test_parallel_reasoning(mock_reasoning, mock_event_store, sample_context):
+async def test_reflective_execution_single_pass(mock_reasoning, mock_event_store, sample_context):
+    """Test reflective execution in a single structured model call."""
+    pattern = ReflectiveExecution(mock_reasoning, single_pass=True)
+
+    mock_reasoning.reason.return_value = {
+        "id": "id1",
+        "response": (
+            '{"iterations": 2, "results": ["draft", "revised"], '
+            '"reflections": ["tighten the draft"], "final_result": "revised"}'
+        )
+    }
+
+    with patch.object(pattern, "_m_steps") as steps:
+        result = await pattern.execute(sample_context, "test prompt")
+
+    # Two answers and one reflection, as the iterative path would count them
+    steps.observe.assert_called_once_with(3)
+    assert result["initial_result"] == "draft"
+    assert result["reflections"] == ["tighten the draft"]
+    assert result["final_result"] == "revised"
+
+    mock_reasoning.reason.assert_called_once()
+    mock_reasoning.reflect.assert_not_called()
+
+@pytest.mark.parametrize("iterations", ['null', '"two"', 'true', '-1'])
+async def test_reflective_execution_single_pass_bad_iterations(mock_reasoning, sample_context, iterations):
+    """Test that a malformed iteration count falls back to the number of results."""
+    pattern = ReflectiveExecution(mock_reasoning, single_pass=True)
+
+    mock_reasoning.reason.return_value = {
+        "id": "id1",
+        "response": (
+            f'{{"iterations": {iterations}, "results": ["draft", "revised"], '
+            '"final_result": "revised"}'
+        )
+    }
+
+    with patch.object(pattern, "_m_steps") as steps:
+        result = await pattern.execute(sample_context, "test prompt")
+
+    steps.observe.assert_called_once_with(2)
+    assert result["reflections"] == []
+    assert result["final_result"] == "revised"
+
+async def test_reflective_execution_single_pass_fallback(mock_reasoning, mock_event_store, sample_context):
+    """Test fallback to iterative reflection on unstructured output."""
+    pattern = ReflectiveExecution(mock_reasoning, max_iterations=1, single_pass=True)
+
+    mock_reasoning.reason.side_effect = [
+        {"id": "id0", "response": "not json"},
+        {"id": "id1", "response": "initial response"},
+        {"id": "id2", "response": "final response"}
+    ]
+    mock_reasoning.reflect.return_value = {"reflection": "reflection 1"}
+
+    result = await pattern.execute(sample_context, "test prompt")
+
+    assert result["initial_result"]["response"] == "initial response"
+    assert len(result["reflections"]) == 1
+    assert result["final_result"]["response"] == "final response"
+    assert mock_reasoning.reason.call_count == 3
+
+async def test_parallel_reasoning(mock_reasoning,mock_event_store, sample_context):
     """Test parallel reasoning pattern."""
-    async def approach1(context):
-        return {"thought": "approach 1", "confidence": 0.7}
-    
-    async def approach2(context):
-        return {"thought": "approach 2", "confidence": 0.8}
-    
     pattern = ParallelReasoning(mock_reasoning, [approach1, approach2])
     
     result = await pattern.execute(sample_context, "test prompt")
@@ -120,15 +187,8 @@ async def test_parallel_reasoning(mock_reasoning, mock_event_store, sample_conte
     assert len(result["thoughts"]) == 2
     assert result["confidence"] == 0.75  # Average of 0.7 and 0.8
 
-@pytest.mark.asyncio
 async def test_parallel_reasoning_error_handling(mock_reasoning, mock_event_store, sample_context):
     """Test parallel reasoning error handling."""
-    async def good_approach(context):
-        return {"thought": "good", "confidence": 0.8}
-    
-    async def bad_approach(context):
-        raise ValueError("Test error")
-    
     pattern = ParallelReasoning(mock_reasoning, [good_approach, bad_approach])
     
     result = await pattern.execute(sample_context, "test prompt")
@@ -138,7 +198,6 @@ async def test_parallel_reasoning_error_handling(mock_reasoning, mock_event_stor
     assert result["thoughts"][0]["thought"] == "good"
     assert result["confidence"] == 0.8
 
-@pytest.mark.asyncio
 async def test_parallel_reasoning_empty_approaches(mock_reasoning, mock_event_store, sample_context):
     """Test parallel reasoning with no approaches."""
     pattern = ParallelReasoning(mock_reasoning, [])
@@ -146,7 +205,6 @@ async def test_parallel_reasoning_empty_approaches(mock_reasoning, mock_event_st
     with pytest.raises(ValueError, match="No reasoning approaches provided"):
         await pattern.execute(sample_context, "test prompt")
 
-@pytest.mark.asyncio
 async def test_parallel_reasoning_execution(mock_reasoning, mock_event_store, sample_context):
     """Test that approaches run in parallel."""
     start_times = []
@@ -183,40 +241,86 @@ async def test_parallel_reasoning_execution(mock_reasoning, mock_event_store, sa
     assert len(result["thoughts"]) == 2
     assert result["confidence"] == 0.75  # (0.7 + 0.8) / 2
 
-@pytest.mark.asyncio
-async def test_workflow_patterns_factory(mock_reasoning, mock_event_store):
+async def test_parallel_reasoning_many_approaches(mock_reasoning, sample_context):
+    """Test that every approach is in flight at once, however many there are."""
+    count = 32
+    started = 0
+    all_started = asyncio.Event()
+    
+    def make_approach(i):
+        async def approach(context):
+            nonlocal started
+            started += 1
+            if started == count:
+                all_started.set()
+            # Deadlocks unless all approaches run concurrently
+            await all_started.wait()
+            return {"thought": f"approach {i}", "confidence": i / count}
+        return approach
+    
+    pattern = ParallelReasoning(mock_reasoning, [make_approach(i) for i in range(count)])
+    
+    result = await asyncio.wait_for(pattern.execute(sample_context, "test prompt"), timeout=1)
+    
+    assert [t["thought"] for t in result["thoughts"]] == [f"approach {i}" for i in range(count)]
+    assert result["confidence"] == pytest.approx((count - 1) / 2 / count)
+
+@pytest.mark.parametrize("factory_name,args,expected_cls", [
+    ("chain_of_thought", (), ChainOfThought),
+    ("reflective_execution", (), ReflectiveExecution),
+    ("parallel_reasoning", ([approach],), ParallelReasoning)
+])
+async def test_workflow_patterns_factory(mock_reasoning, mock_event_store, factory_name, args, expected_cls):
     """Test workflow patterns factory."""
     patterns = WorkflowPatterns(mock_reasoning, mock_event_store)
     
-    chain = patterns.chain_of_thought()
-    assert isinstance(chain, ChainOfThought)
-    
-    reflective = patterns.reflective_execution()
-    assert isinstance(reflective, ReflectiveExecution)
+    assert isinstance(getattr(patterns, factory_name)(*args), expected_cls)
+
+async def test_workflow_patterns_factory_caching(mock_reasoning, mock_event_store):
+    """Test that the factory reuses pattern instances."""
+    patterns = WorkflowPatterns(mock_reasoning, mock_event_store)
     
-    async def approach(context):
-        return {"thought": "test", "confidence": 0.5}
+    assert patterns.chain_of_thought() is patterns.chain_of_thought()
+    assert patterns.reflective_execution() is patterns.reflective_execution()
     
     parallel = patterns.parallel_reasoning([approach])
-    assert isinstance(parallel, ParallelReasoning)
+    assert patterns.parallel_reasoning([approach]) is parallel
+    
+    # Least recently used entries are evicted past the cache limit
+    patterns.MAX_CACHED_PATTERNS = 1
+    
+    patterns.parallel_reasoning([other_approach])
+    assert patterns.parallel_reasoning([approach]) is not parallel
+
+async def test_workflow_patterns_from_clients(mock_event_store):
+    """Test that patterns built from clients share one reasoning engine."""
+    patterns = WorkflowPatterns.from_clients(
+        MagicMock(), MagicMock(), mock_event_store
+    )
+    
+    assert isinstance(patterns.reasoning, ReasoningEngine)
+    assert patterns.chain_of_thought().reasoning is patterns.reasoning
+    assert patterns.reflective_execution().reasoning is patterns.reasoning
 
-@pytest.mark.asyncio
 async def test_pattern_execution_recording(mock_reasoning, mock_event_store, sample_context):
     """Test pattern execution recording."""
     patterns = WorkflowPatterns(mock_reasoning, mock_event_store)
     workflow_id = uuid4()
     
-    await patterns.record_pattern_execution(
+    stored = await patterns.record_pattern_execution(
         workflow_id=workflow_id,
         pattern_name="test_pattern",
         context=sample_context,
         result={"key": "value"}
     )
+    assert await stored == "event-0"
+    await patterns.close()
     
-    mock_event_store.store_event.assert_called_once_with(
-        workflow_id=workflow_id,
-        event_type="pattern_execution",
-        event_data={
+    mock_event_store.store_event.assert_not_called()
+    mock_event_store.store_event_many.assert_called_once_with([{
+        "workflow_id": workflow_id,
+        "event_type": "pattern_execution",
+        "event_data": {
             "pattern": "test_pattern",
             "context": {
                 "tenant_id": sample_context.state.tenant_id,
@@ -224,4 +328,21 @@ async def test_pattern_execution_recording(mock_reasoning, mock_event_store, sam
             },
             "result": {"key": "value"}
         }
-    )
+    }])
+
+async def test_pattern_execution_recording_batches(mock_reasoning, mock_event_store, sample_context):
+    """Test that events queued together are stored in one batch."""
+    patterns = WorkflowPatterns(mock_reasoning, mock_event_store)
+    
+    for name in ("first", "second", "third"):
+        await patterns.record_pattern_execution(
+            workflow_id=uuid4(),
+            pattern_name=name,
+            context=sample_context,
+            result={}
+        )
+    await patterns.close()
+    
+    mock_event_store.store_event_many.assert_called_once()
+    batch = mock_event_store.store_event_many.call_args.args[0]
+    assert [event["event_data"]["pattern"] for event in batch] == ["first", "second", "third"]
@@ -1,64 +1,31 @@
 """Tests for workflow service."""
 
 import asyncio
+import itertools
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from uuid import uuid4
+from uuid import UUID
 
-from src.agent_runtime.context import AgentContext, AgentState
-from src.agent_runtime.reasoning import ReasoningEngine
-from src.infrastructure.event_store import EventStore
+from src.infrastructure.event_store import EventBuffer
 from src.workflows.workflow_service import WorkflowService
 
-@pytest.fixture
-def mock_db():
-    """Mock database connection."""
-    db = AsyncMock()
-    db.execute = AsyncMock(return_value={"status": "success"})
-    return db
-
-@pytest.fixture
-def mock_event_store():
-    """Mock event store."""
-    event_store = AsyncMock(spec=EventStore)
-    event_store.store_event = AsyncMock()
-    event_store.list_workflows = AsyncMock(return_value=[])
-    return event_store
+# Test workflow IDs only need to be distinct, not random
+_counter = itertools.count(1)
 
-@pytest.fixture
-def sample_context():
-    """Sample agent context."""
-    state = AgentState(
-        tenant_id="test_tenant",
-        variables={
-            "session_id": "test_session",
-            "user_id": "test_user"
-        }
-    )
-    return AgentContext(
-        state=state,
-        model_config={
-            "model": "gpt-4",
-            "temperature": 0.7
-        },
-        tool_config={
-            "max_retries": 3,
-            "timeout": 30
-        },
-        workflow_config={},
-        tenant_config=None
-    )
+def _next_uuid() -> UUID:
+    """Return a run-unique UUID without reading os.urandom."""
+    return UUID(int=next(_counter))
 
 @pytest.fixture
-def workflow_service(mock_db, mock_event_store):
+async def workflow_service(mock_db, mock_event_store):
     """Create workflow service instance."""
     service = WorkflowService(db=mock_db, event_store=mock_event_store)
-    return service
+    yield service
+    # The mocks outlive the test, so stop the background health probe
+    await service.close()
 
-@pytest.mark.asyncio
 async def test_execute_workflow(workflow_service, sample_context):
     """Test executing a workflow."""
-    workflow_id = str(uuid4())
+    workflow_id = str(_next_uuid())
     user_id = "test_user"
     
     result = await workflow_service.execute_workflow(workflow_id, user_id)
@@ -66,20 +33,59 @@ async def test_execute_workflow(workflow_service, sample_context):
     assert result is not None
     assert result["workflow_id"] == workflow_id
 
-@pytest.mark.asyncio
+async def test_execute_workflow_skips_repeated_health_probe(workflow_service):
+    """Test that only the first execution probes the database inline."""
+    user_id = "test_user"
+    
+    await workflow_service.execute_workflow(str(_next_uuid()), user_id)
+    await workflow_service.execute_workflow(str(_next_uuid()), user_id)
+    
+    workflow_service.db.execute.assert_called_once_with("SELECT 1")
+    
+    # An unhealthy flag from the background probe fails fast
+    workflow_service._db_healthy = False
+    with pytest.raises(ConnectionError):
+        await workflow_service.execute_workflow(str(_next_uuid()), user_id)
+    
+    await workflow_service.close()
+
+async def test_concurrent_first_executions_share_one_probe(workflow_service):
+    """Test that concurrent first calls start a single probe and health loop."""
+    release = asyncio.Event()
+    
+    async def slow_probe(*args):
+        await release.wait()
+    
+    workflow_service.db.execute.side_effect = slow_probe
+    calls = [
+        asyncio.create_task(workflow_service.execute_workflow(str(_next_uuid()), "test_user"))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    health_task = workflow_service._health_task
+    
+    release.set()
+    results = await asyncio.gather(*calls)
+    
+    assert all(result["status"] == "running" for result in results)
+    workflow_service.db.execute.assert_called_once_with("SELECT 1")
+    assert workflow_service._health_task is health_task
+    
+    await workflow_service.close()
+    assert health_task.cancelled()
+
 async def test_get_workflow_status(workflow_service):
     """Test getting workflow status."""
-    workflow_id = str(uuid4())
+    workflow_id = str(_next_uuid())
     user_id = "test_user"
     
     status = await workflow_service.get_workflow_status(workflow_id, user_id)
     
     assert status is not None
 
-@pytest.mark.asyncio
 async def test_workflow_error_handling(workflow_service, sample_context):
     """Test workflow error handling."""
-    workflow_id = str(uuid4())
+    workflow_id = str(_next_uuid())
     user_id = "test_user"
     
     # Mock database error
@@ -90,26 +96,31 @@ async def test_workflow_error_handling(workflow_service, sample_context):
     
     assert str(exc.value) == "Database error"
 
-@pytest.mark.asyncio
 async def test_workflow_timeout(workflow_service, sample_context):
     """Test workflow timeout handling."""
-    workflow_id = str(uuid4())
+    workflow_id = str(_next_uuid())
     user_id = "test_user"
     
-    # Mock slow database operation
-    async def slow_operation(*args, **kwargs):
-        await asyncio.sleep(0.2)
-        return {}
+    # Mock a database operation that never completes
+    reached = asyncio.Event()
     
-    workflow_service.db.execute.side_effect = slow_operation
+    async def hung_operation(*args, **kwargs):
+        reached.set()
+        await asyncio.get_running_loop().create_future()
     
+    workflow_service.db.execute.side_effect = hung_operation
+    
+    # The call blocks on a future that never resolves, so only the
+    # timeout can end it
     with pytest.raises(asyncio.TimeoutError):
         await asyncio.wait_for(
             workflow_service.execute_workflow(workflow_id, user_id),
-            timeout=0.1
+            timeout=0.01
         )
+    
+    assert reached.is_set()
+    workflow_service.db.execute.assert_called_once_with("SELECT 1")
 
-@pytest.mark.asyncio
 async def test_start_workflow(workflow_service, sample_context):
     """Test starting a workflow."""
     workflow_id = await workflow_service.start_workflow(
@@ -118,18 +129,65 @@ async def test_start_workflow(workflow_service, sample_context):
     )
     
     assert workflow_id is not None
-    workflow_service.event_store.store_event.assert_called_once()
+    workflow_service.event_store.store_event_many.assert_called_once()
+    (event,) = workflow_service.event_store.store_event_many.call_args.args[0]
+    assert event["workflow_id"] == workflow_id
+    assert event["event_type"] == "workflow_started"
 
-@pytest.mark.asyncio
 async def test_cancel_workflow(workflow_service):
     """Test canceling a workflow."""
-    workflow_id = uuid4()
+    workflow_id = _next_uuid()
     
-    await workflow_service.cancel_workflow(workflow_id)
+    assert await workflow_service.cancel_workflow(workflow_id) is True
     
-    workflow_service.event_store.store_event.assert_called_once()
+    workflow_service.event_store.store_event_many.assert_called_once_with([{
+        "workflow_id": workflow_id,
+        "event_type": "workflow_cancelled",
+        "event_data": {}
+    }])
+
+async def test_event_store_failure_raises_to_each_caller(workflow_service):
+    """Test that a failed batch is reported to every caller whose event it held."""
+    workflow_service.event_store.store_event_many.side_effect = Exception("Database error")
+    
+    results = await asyncio.gather(
+        workflow_service.cancel_workflow(_next_uuid()),
+        workflow_service.cancel_workflow(_next_uuid()),
+        return_exceptions=True
+    )
+    
+    assert [str(result) for result in results] == ["Database error"] * 2
+    workflow_service.event_store.store_event_many.assert_called_once()
+    
+    # Later events are unaffected by the earlier failure
+    workflow_service.event_store.store_event_many.side_effect = None
+    workflow_service.event_store.store_event_many.return_value = ["event-0"]
+    assert await workflow_service.cancel_workflow(_next_uuid()) is True
+    await workflow_service.flush_events()
+
+async def test_event_buffer_blocks_when_full(mock_event_store):
+    """Test that producers wait instead of growing the queue past its limit."""
+    release = asyncio.Event()
+    
+    async def slow_store(events):
+        await release.wait()
+        return [f"event-{i}" for i in range(len(events))]
+    
+    mock_event_store.store_event_many.side_effect = slow_store
+    buffer = EventBuffer(mock_event_store, max_queued=1)
+    
+    first = await buffer.put(_next_uuid(), "first", {})
+    await asyncio.sleep(0)  # The drain task takes the first event
+    await buffer.put(_next_uuid(), "second", {})
+    third = asyncio.create_task(buffer.put(_next_uuid(), "third", {}))
+    await asyncio.sleep(0)
+    assert not third.done()
+    
+    release.set()
+    assert await first == "event-0"
+    assert await (await third) == "event-0"
+    await buffer.close()
 
-@pytest.mark.asyncio
 async def test_list_workflows(workflow_service):
     """Test listing workflows."""
     tenant_id = "test_tenant"
@@ -139,10 +197,9 @@ async def test_list_workflows(workflow_service):
     assert isinstance(workflows, list)
     workflow_service.event_store.list_workflows.assert_called_once_with(tenant_id)
 
-@pytest.mark.asyncio
 async def test_workflow_retry(workflow_service):
     """Test workflow retry."""
-    workflow_id = uuid4()
+    workflow_id = _next_uuid()
     
     result = await workflow_service.retry_workflow(workflow_id)
     